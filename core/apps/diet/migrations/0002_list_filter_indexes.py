@@ -0,0 +1,33 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("diet", "0001_initial"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="nutritionplan",
+            index=models.Index(
+                fields=["member", "is_active"], name="nutrition_plans_member_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nutritionplan",
+            index=models.Index(
+                fields=["trainer", "is_active"], name="nutrition_plans_trainer_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="nutritionplan",
+            index=models.Index(
+                fields=["is_active", "meal_type"], name="nutrition_plans_meal_idx"
+            ),
+        ),
+    ]
@@ -14,6 +14,17 @@ class NutritionPlan(models.Model):
 
     class Meta:
         db_table = "nutrition_plans"
+        indexes = [
+            models.Index(
+                fields=["member", "is_active"], name="nutrition_plans_member_idx"
+            ),
+            models.Index(
+                fields=["trainer", "is_active"], name="nutrition_plans_trainer_idx"
+            ),
+            models.Index(
+                fields=["is_active", "meal_type"], name="nutrition_plans_meal_idx"
+            ),
+        ]
 
     trainer = models.ForeignKey(
         User,
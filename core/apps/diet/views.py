@@ -19,6 +19,13 @@ User = get_user_model()
 class NutritionPlanViewSet(viewsets.ModelViewSet):
     serializer_class = NutritionPlanSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
+    filter_fields = {
+        "member": "member",
+        "trainer": "trainer",
+        "meal_type": "meal_type",
+    }
+    ordering_fields = ["id"]
+    ordering = ["-id"]
 
     def get_queryset(self):
         user = self.request.user
@@ -1,6 +1,32 @@
 from django.apps import AppConfig
+from django.conf import settings
 
 
 class MembershipConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core.apps.membership"
+
+    def ready(self):
+        from core.apps.membership import signals  # noqa: F401
+        from core.apps.membership.models import Membership, MembershipMonthlySnapshot
+        from core.apps.users.scheduling.scheduling import scheduler
+
+        expiry = settings.MEMBERSHIP_EXPIRY
+        if expiry["SCHEDULER_ENABLED"]:
+            scheduler.schedule(
+                "membership-expiry",
+                lambda: Membership.objects.deactivate_expired(triggered_by="scheduler"),
+                interval=expiry["INTERVAL_SECONDS"],
+                initial_delay=expiry["INITIAL_DELAY_SECONDS"],
+            )
+
+        snapshots = settings.MEMBERSHIP_SNAPSHOTS
+        if snapshots["SCHEDULER_ENABLED"]:
+            scheduler.schedule(
+                "membership-snapshots",
+                lambda: MembershipMonthlySnapshot.objects.refresh(
+                    MembershipMonthlySnapshot.objects.default_months()
+                ),
+                interval=snapshots["INTERVAL_SECONDS"],
+                initial_delay=snapshots["INITIAL_DELAY_SECONDS"],
+            )
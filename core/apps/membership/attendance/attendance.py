@@ -0,0 +1,129 @@
+import atexit
+import logging
+import threading
+
+from django.conf import settings
+from django.db import IntegrityError, close_old_connections
+from django.utils import timezone
+
+logger = logging.getLogger(__name__)
+
+
+class AttendanceBuffer:
+    """
+    In-process buffer of attendance events, written with one bulk_create
+    whenever `max_records` events are waiting or the oldest has waited
+    `max_delay_ms`, by a single daemon thread.
+
+    The buffer is flushed at interpreter exit, which covers graceful worker
+    shutdowns. If a batch insert fails the events are written one by one:
+    rows the database rejects are logged and dropped, and the rest are put
+    back and retried, keeping at most `max_pending` of them so a database
+    outage cannot exhaust memory.
+    """
+
+    def __init__(self, max_records=500, max_delay_ms=1000, max_pending=50000):
+        self.max_records = max_records
+        self.max_delay = max_delay_ms / 1000
+        self.max_pending = max_pending
+        self._pending = []
+        self._condition = threading.Condition()
+        self._flush_lock = threading.Lock()
+        self._worker = None
+        atexit.register(self.flush)
+
+    def _ensure_worker(self):
+        if self._worker is None or not self._worker.is_alive():
+            self._worker = threading.Thread(
+                target=self._run, name="attendance-buffer", daemon=True
+            )
+            self._worker.start()
+
+    def _run(self):
+        while True:
+            with self._condition:
+                # Wait for a first event, then until the batch is full or due.
+                while not self._pending:
+                    self._condition.wait()
+                self._condition.wait_for(
+                    lambda: len(self._pending) >= self.max_records,
+                    timeout=self.max_delay,
+                )
+            self.flush()
+            close_old_connections()
+
+    def record(self, member_id, event, source=""):
+        """Queue one event stamped with the current time; returns immediately"""
+        from core.apps.membership.models import Attendance
+
+        now = timezone.now()
+        entry = Attendance(
+            member_id=member_id,
+            event=event,
+            occurred_at=now,
+            day=timezone.localdate(now),
+            source=source,
+        )
+        with self._condition:
+            self._ensure_worker()
+            self._pending.append(entry)
+            # Wake the worker to start the delay clock on the first event and
+            # to write early once the batch is full.
+            if len(self._pending) == 1 or len(self._pending) >= self.max_records:
+                self._condition.notify()
+        return entry
+
+    def flush(self):
+        """Write every pending event now; returns how many were written"""
+        from core.apps.membership.models import Attendance
+
+        with self._flush_lock:
+            with self._condition:
+                batch, self._pending = self._pending, []
+            if not batch:
+                return 0
+            try:
+                Attendance.objects.bulk_create(batch, batch_size=self.max_records)
+            except Exception:
+                logger.warning(
+                    "Could not write %d attendance events at once, retrying one by one",
+                    len(batch),
+                    exc_info=True,
+                )
+            else:
+                return len(batch)
+
+            written = 0
+            for index, entry in enumerate(batch):
+                try:
+                    Attendance.objects.bulk_create([entry])
+                except IntegrityError:
+                    logger.exception(
+                        "Dropping attendance event %s for member %s",
+                        entry.event,
+                        entry.member_id,
+                    )
+                except Exception:
+                    logger.exception(
+                        "Could not write %d attendance events", len(batch) - index
+                    )
+                    self._requeue(batch[index:])
+                    break
+                else:
+                    written += 1
+            return written
+
+    def _requeue(self, entries):
+        with self._condition:
+            self._pending = entries + self._pending
+            dropped = len(self._pending) - self.max_pending
+            if dropped > 0:
+                logger.error("Dropping %d attendance events", dropped)
+                del self._pending[:dropped]
+
+
+attendance_buffer = AttendanceBuffer(
+    max_records=settings.ATTENDANCE_BUFFER["MAX_RECORDS"],
+    max_delay_ms=settings.ATTENDANCE_BUFFER["MAX_DELAY_MS"],
+    max_pending=settings.ATTENDANCE_BUFFER["MAX_PENDING"],
+)
@@ -0,0 +1,112 @@
+import datetime
+import threading
+import time
+
+from django.conf import settings
+from django.db import transaction
+from django.utils import timezone
+
+from core.apps.users.scheduling.scheduling import scheduler
+
+
+class ActiveMemberBitmap:
+    """
+    In-process bitmap of the member ids that hold a membership covering today,
+    one bit per id, so a check-in is a byte lookup with no SQL.
+
+    The bitmap is built on first use, rebuilt in the background every
+    `refresh_interval` seconds (picking up writes made by other processes)
+    and whenever the local date changes, and patched one member at a time
+    from the Membership save/delete signals.
+    """
+
+    def __init__(self, refresh_interval=300):
+        self.refresh_interval = refresh_interval
+        self._lock = threading.Lock()
+        self._build_lock = threading.Lock()
+        self._bits = None
+        # Wall-clock time of the next local midnight, when the bitmap goes stale.
+        self._expires_at = 0.0
+
+    # Building
+
+    def _active_memberships(self, today, **filters):
+        from core.apps.membership.models import Membership
+
+        return Membership.objects.filter(
+            is_active=True, start_date__lte=today, end_date__gte=today, **filters
+        )
+
+    def rebuild(self):
+        today = timezone.localdate()
+        bits = bytearray()
+        member_ids = (
+            self._active_memberships(today)
+            .values_list("member_id", flat=True)
+            .order_by()
+            .iterator(chunk_size=10000)
+        )
+        for member_id in member_ids:
+            bits = self._set(bits, member_id, True)
+        with self._lock:
+            self._bits = bits
+            self._expires_at = timezone.make_aware(
+                datetime.datetime.combine(
+                    today + datetime.timedelta(days=1), datetime.time.min
+                )
+            ).timestamp()
+
+    def ensure_built(self):
+        if time.time() < self._expires_at:
+            return
+        with self._build_lock:
+            if time.time() >= self._expires_at:
+                self.rebuild()
+                scheduler.schedule(
+                    "active-member-bitmap",
+                    self.rebuild,
+                    interval=self.refresh_interval,
+                    initial_delay=self.refresh_interval,
+                )
+
+    @staticmethod
+    def _set(bits, member_id, value):
+        index, mask = member_id >> 3, 1 << (member_id & 7)
+        if index >= len(bits):
+            if not value:
+                return bits
+            bits.extend(bytes(index + 1 - len(bits)))
+        if value:
+            bits[index] |= mask
+        else:
+            bits[index] &= ~mask
+        return bits
+
+    # Incremental updates
+
+    def refresh_member(self, member_id):
+        """Re-check one member once the current transaction commits"""
+
+        def refresh():
+            if self._bits is None:
+                return
+            active = self._active_memberships(
+                timezone.localdate(), member_id=member_id
+            ).exists()
+            with self._lock:
+                self._bits = self._set(self._bits, member_id, active)
+
+        transaction.on_commit(refresh)
+
+    # Querying
+
+    def is_active(self, member_id):
+        self.ensure_built()
+        bits = self._bits
+        index = member_id >> 3
+        return index < len(bits) and bool(bits[index] & (1 << (member_id & 7)))
+
+
+active_members = ActiveMemberBitmap(
+    refresh_interval=settings.MEMBERSHIP_CHECKIN["REFRESH_SECONDS"]
+)
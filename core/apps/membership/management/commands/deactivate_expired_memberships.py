@@ -0,0 +1,38 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from core.apps.membership.models import Membership
+
+
+class Command(BaseCommand):
+    help = "Deactivate every active membership whose end_date has passed"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--today",
+            help="Treat this date (YYYY-MM-DD) as today instead of the current date",
+        )
+        parser.add_argument(
+            "--dry-run",
+            action="store_true",
+            help="Only report how many memberships would be deactivated",
+        )
+
+    def handle(self, *args, **options):
+        today = None
+        if options["today"]:
+            today = parse_date(options["today"])
+            if today is None:
+                raise CommandError("--today must be a date in YYYY-MM-DD format")
+
+        if options["dry_run"]:
+            count = Membership.objects.expired(today).count()
+            self.stdout.write(f"{count} memberships would be deactivated")
+            return
+
+        run = Membership.objects.deactivate_expired(today=today)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Deactivated {run.deactivated_count} memberships ending before {run.cutoff_date} (run {run.pk})"
+            )
+        )
@@ -0,0 +1,62 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from core.apps.membership.models import (
+    Membership,
+    MembershipMonthlySnapshot,
+    month_start,
+    next_month,
+)
+
+
+def parse_month(value, option):
+    if not value:
+        return None
+    try:
+        day = parse_date(f"{value}-01")
+    except ValueError:
+        day = None
+    if day is None:
+        raise CommandError(f"{option} must be a month in YYYY-MM format")
+    return day
+
+
+class Command(BaseCommand):
+    help = "Recompute monthly membership snapshots from memberships"
+
+    def add_arguments(self, parser):
+        parser.add_argument("--since", help="First month to recompute (YYYY-MM)")
+        parser.add_argument("--until", help="Last month to recompute (YYYY-MM)")
+        parser.add_argument(
+            "--all",
+            action="store_true",
+            help="Recompute every month from the earliest membership to the latest",
+        )
+
+    def handle(self, *args, **options):
+        if options["all"]:
+            first = Membership.objects.order_by("start_date").first()
+            last = Membership.objects.order_by("-end_date").first()
+            if first is None:
+                self.stdout.write("No memberships to snapshot")
+                return
+            since, until = month_start(first.start_date), month_start(last.end_date)
+        else:
+            months = MembershipMonthlySnapshot.objects.default_months()
+            since = parse_month(options["since"], "--since") or months[0]
+            until = parse_month(options["until"], "--until") or months[-1]
+        if since > until:
+            raise CommandError("--since must not be after --until")
+
+        months = []
+        month = since
+        while month <= until:
+            months.append(month)
+            month = next_month(month)
+
+        MembershipMonthlySnapshot.objects.refresh(months)
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Recomputed snapshots for {len(months)} months ({since:%Y-%m} to {until:%Y-%m})"
+            )
+        )
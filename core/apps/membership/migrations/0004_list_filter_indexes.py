@@ -0,0 +1,30 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        (
+            "membership",
+            "0003_alter_membership_end_date_alter_membership_is_active_and_more",
+        ),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="membership",
+            index=models.Index(
+                fields=["member", "is_active"], name="memberships_member_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="membership",
+            index=models.Index(
+                fields=["is_active", "end_date"], name="memberships_end_date_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,83 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:44
+
+import django.db.models.deletion
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0004_list_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MembershipExpiryRun",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "started_at",
+                    models.DateTimeField(
+                        default=django.utils.timezone.now,
+                        help_text="Date and time when the sweep started",
+                    ),
+                ),
+                (
+                    "finished_at",
+                    models.DateTimeField(
+                        blank=True,
+                        help_text="Date and time when the sweep finished",
+                        null=True,
+                    ),
+                ),
+                (
+                    "cutoff_date",
+                    models.DateField(
+                        help_text="Memberships that ended before this date were deactivated"
+                    ),
+                ),
+                (
+                    "deactivated_count",
+                    models.PositiveIntegerField(
+                        default=0,
+                        help_text="Number of memberships this sweep deactivated",
+                    ),
+                ),
+                (
+                    "triggered_by",
+                    models.CharField(
+                        choices=[
+                            ("command", "Management command"),
+                            ("scheduler", "In-process scheduler"),
+                        ],
+                        help_text="What started this sweep",
+                        max_length=20,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "membership_expiry_runs",
+            },
+        ),
+        migrations.AddField(
+            model_name="membership",
+            name="expiry_run",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Expiry sweep that deactivated this membership, if any",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="deactivated_memberships",
+                to="membership.membershipexpiryrun",
+            ),
+        ),
+    ]
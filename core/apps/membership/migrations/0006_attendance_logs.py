@@ -0,0 +1,81 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:47
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0005_membership_expiry_runs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="Attendance",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "event",
+                    models.CharField(
+                        choices=[("in", "Check-in"), ("out", "Check-out")],
+                        help_text="Whether the member entered or left",
+                        max_length=3,
+                    ),
+                ),
+                (
+                    "occurred_at",
+                    models.DateTimeField(
+                        help_text="Date and time the scanner recorded the event"
+                    ),
+                ),
+                (
+                    "day",
+                    models.DateField(
+                        help_text="Local date of occurred_at, for per-day queries"
+                    ),
+                ),
+                (
+                    "source",
+                    models.CharField(
+                        blank=True,
+                        default="",
+                        help_text="Scanner or device that recorded the event",
+                        max_length=50,
+                    ),
+                ),
+                (
+                    "member",
+                    models.ForeignKey(
+                        help_text="Member who checked in or out",
+                        limit_choices_to={"role": "member"},
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="attendance",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "attendance_logs",
+                "indexes": [
+                    models.Index(
+                        fields=["day", "member", "occurred_at"],
+                        name="attendance_day_idx",
+                    ),
+                    models.Index(
+                        fields=["member", "occurred_at"], name="attendance_member_idx"
+                    ),
+                ],
+            },
+        ),
+    ]
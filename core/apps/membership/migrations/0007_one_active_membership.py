@@ -0,0 +1,51 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:47
+
+from django.conf import settings
+from django.db import migrations, models
+from django.db.models import Count
+
+
+def deactivate_duplicate_memberships(apps, schema_editor):
+    """Keep only the latest-ending active membership of each member active"""
+    Membership = apps.get_model("membership", "Membership")
+    members = list(
+        Membership.objects.filter(is_active=True)
+        .values("member_id")
+        .annotate(active=Count("id"))
+        .filter(active__gt=1)
+        .values_list("member_id", flat=True)
+    )
+    for member_id in members:
+        keep = (
+            Membership.objects.filter(member_id=member_id, is_active=True)
+            .order_by("-end_date", "-id")
+            .values_list("id", flat=True)
+            .first()
+        )
+        Membership.objects.filter(member_id=member_id, is_active=True).exclude(
+            id=keep
+        ).update(is_active=False)
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0006_attendance_logs"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.RunPython(
+            deactivate_duplicate_memberships, migrations.RunPython.noop
+        ),
+        migrations.AddConstraint(
+            model_name="membership",
+            constraint=models.UniqueConstraint(
+                models.Case(
+                    models.When(is_active=True, then=models.F("member")),
+                    default=models.Value(None),
+                ),
+                name="memberships_one_active_uniq",
+            ),
+        ),
+    ]
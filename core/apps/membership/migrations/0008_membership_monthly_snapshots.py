@@ -0,0 +1,93 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:49
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("membership", "0007_one_active_membership"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MembershipMonthlySnapshot",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "month",
+                    models.DateField(help_text="First day of the month summarised"),
+                ),
+                (
+                    "plan_type",
+                    models.CharField(
+                        choices=[
+                            ("basic", "Basic"),
+                            ("quarterly", "Quarterly"),
+                            ("yearly", "Yearly"),
+                        ],
+                        help_text="Membership plan type summarised",
+                        max_length=20,
+                    ),
+                ),
+                (
+                    "active_members",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Members holding this plan on the last day of the month",
+                    ),
+                ),
+                (
+                    "started",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Memberships of this plan starting in the month",
+                    ),
+                ),
+                (
+                    "renewals",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Memberships starting in the month for members who had one before",
+                    ),
+                ),
+                (
+                    "expiring",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Memberships of this plan ending in the month",
+                    ),
+                ),
+                (
+                    "churned",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Memberships ending in the month that no later membership follows",
+                    ),
+                ),
+                (
+                    "computed_at",
+                    models.DateTimeField(
+                        help_text="Date and time this snapshot was computed"
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "membership_monthly_snapshots",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("month", "plan_type"),
+                        name="membership_snapshot_month_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -1,10 +1,90 @@
-from django.db import models
+import datetime
+
+from django.conf import settings
+from django.db import models, transaction
+from django.db.models import Case, Count, Exists, F, OuterRef, Q, Value, When
+from django.utils import timezone
 from core.apps.users.models import User
 
 
+ONE_ACTIVE_MEMBERSHIP = "memberships_one_active_uniq"
+
+
+class MembershipQuerySet(models.QuerySet):
+    def expired(self, today=None):
+        """Active memberships whose end_date has passed"""
+        return self.filter(is_active=True, end_date__lt=today or timezone.localdate())
+
+    def deactivate_expired(self, triggered_by="command", today=None):
+        """
+        Deactivate every expired membership with a single UPDATE served by
+        memberships_end_date_idx, tagging the rows with the returned
+        MembershipExpiryRun so the change can be audited or reverted.
+        """
+        today = today or timezone.localdate()
+        with transaction.atomic():
+            run = MembershipExpiryRun.objects.create(
+                cutoff_date=today, triggered_by=triggered_by
+            )
+            run.deactivated_count = self.expired(today).update(
+                is_active=False, expiry_run=run
+            )
+            run.finished_at = timezone.now()
+            run.save(update_fields=["deactivated_count", "finished_at"])
+        return run
+
+
+class MembershipExpiryRun(models.Model):
+    """One execution of the membership expiry sweep"""
+
+    TRIGGERS = [
+        ("command", "Management command"),
+        ("scheduler", "In-process scheduler"),
+    ]
+
+    class Meta:
+        db_table = "membership_expiry_runs"
+
+    started_at = models.DateTimeField(
+        default=timezone.now, help_text="Date and time when the sweep started"
+    )
+    finished_at = models.DateTimeField(
+        blank=True, null=True, help_text="Date and time when the sweep finished"
+    )
+    cutoff_date = models.DateField(
+        help_text="Memberships that ended before this date were deactivated"
+    )
+    deactivated_count = models.PositiveIntegerField(
+        default=0, help_text="Number of memberships this sweep deactivated"
+    )
+    triggered_by = models.CharField(
+        max_length=20, choices=TRIGGERS, help_text="What started this sweep"
+    )
+
+    def __str__(self):
+        return (
+            f"Expiry sweep {self.started_at:%Y-%m-%d %H:%M} ({self.deactivated_count})"
+        )
+
+
 class Membership(models.Model):
     class Meta:
         db_table = "memberships"
+        indexes = [
+            models.Index(fields=["member", "is_active"], name="memberships_member_idx"),
+            models.Index(
+                fields=["is_active", "end_date"], name="memberships_end_date_idx"
+            ),
+        ]
+        constraints = [
+            # One active membership per member. Inactive rows index as NULL,
+            # which never collides; MySQL has no partial indexes, so this
+            # functional index stands in for a conditional constraint.
+            models.UniqueConstraint(
+                Case(When(is_active=True, then=F("member")), default=Value(None)),
+                name=ONE_ACTIVE_MEMBERSHIP,
+            ),
+        ]
 
     class PlanChoices(models.TextChoices):
         BASIC = "basic", "Basic"
@@ -27,3 +107,192 @@ class Membership(models.Model):
     is_active = models.BooleanField(
         default=True, help_text="Whether this membership is currently active"
     )
+    expiry_run = models.ForeignKey(
+        MembershipExpiryRun,
+        on_delete=models.SET_NULL,
+        blank=True,
+        null=True,
+        related_name="deactivated_memberships",
+        help_text="Expiry sweep that deactivated this membership, if any",
+    )
+
+    objects = MembershipQuerySet.as_manager()
+
+
+class AttendanceQuerySet(models.QuerySet):
+    def present(self, day=None):
+        """Latest event of each member on `day` (default today) when it is a check-in"""
+        day = day or timezone.localdate()
+        later = Attendance.objects.filter(
+            day=day,
+            member_id=OuterRef("member_id"),
+            occurred_at__gt=OuterRef("occurred_at"),
+        )
+        return self.filter(day=day, event="in").exclude(Exists(later))
+
+
+class Attendance(models.Model):
+    """
+    Append-only log of gym check-ins and check-outs. Rows are written in
+    batches by the attendance buffer and never updated.
+    """
+
+    EVENTS = [
+        ("in", "Check-in"),
+        ("out", "Check-out"),
+    ]
+
+    class Meta:
+        db_table = "attendance_logs"
+        indexes = [
+            # Occupancy queries read one day, member by member, in time order.
+            models.Index(
+                fields=["day", "member", "occurred_at"], name="attendance_day_idx"
+            ),
+            models.Index(
+                fields=["member", "occurred_at"], name="attendance_member_idx"
+            ),
+        ]
+
+    member = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="attendance",
+        limit_choices_to={"role": "member"},
+        help_text="Member who checked in or out",
+    )
+    event = models.CharField(
+        max_length=3, choices=EVENTS, help_text="Whether the member entered or left"
+    )
+    occurred_at = models.DateTimeField(
+        help_text="Date and time the scanner recorded the event"
+    )
+    day = models.DateField(help_text="Local date of occurred_at, for per-day queries")
+    source = models.CharField(
+        max_length=50,
+        blank=True,
+        default="",
+        help_text="Scanner or device that recorded the event",
+    )
+
+    objects = AttendanceQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.member_id} {self.event} at {self.occurred_at}"
+
+
+def month_start(day):
+    return day.replace(day=1)
+
+
+def next_month(month):
+    return (month + datetime.timedelta(days=32)).replace(day=1)
+
+
+class MembershipMonthlySnapshotQuerySet(models.QuerySet):
+    def _aggregate_month(self, month):
+        """Per-plan figures for one month from memberships, as one grouped query"""
+        last_day = next_month(month) - datetime.timedelta(days=1)
+        started = Q(start_date__gte=month, start_date__lte=last_day)
+        ended = Q(end_date__gte=month, end_date__lte=last_day)
+        earlier = Membership.objects.filter(
+            member_id=OuterRef("member_id"), start_date__lt=OuterRef("start_date")
+        )
+        later = Membership.objects.filter(
+            member_id=OuterRef("member_id"), start_date__gt=OuterRef("start_date")
+        )
+        return (
+            Membership.objects.filter(Q(start_date__lte=last_day, end_date__gte=month))
+            .values("plan_type")
+            .order_by()
+            .annotate(
+                active_members=Count(
+                    "member",
+                    distinct=True,
+                    filter=Q(start_date__lte=last_day, end_date__gte=last_day),
+                ),
+                started=Count("id", filter=started),
+                renewals=Count("id", filter=started & Q(Exists(earlier))),
+                expiring=Count("id", filter=ended),
+                churned=Count("id", filter=ended & ~Q(Exists(later))),
+            )
+        )
+
+    def default_months(self, today=None):
+        """The previous month through MONTHS_AHEAD months ahead"""
+        current = month_start(today or timezone.localdate())
+        month = month_start(current - datetime.timedelta(days=1))
+        months = []
+        for _ in range(settings.MEMBERSHIP_SNAPSHOTS["MONTHS_AHEAD"] + 2):
+            months.append(month)
+            month = next_month(month)
+        return months
+
+    def refresh(self, months):
+        """Recompute the snapshots of the given months (first days)"""
+        now = timezone.now()
+        # Replace each month wholesale rather than upserting: it drops plans
+        # that no longer have rows and works the same on every backend.
+        with transaction.atomic():
+            for month in sorted(set(months)):
+                rows = list(self._aggregate_month(month))
+                self.filter(month=month).delete()
+                self.bulk_create(
+                    [self.model(month=month, computed_at=now, **row) for row in rows]
+                )
+        return len(set(months))
+
+
+class MembershipMonthlySnapshot(models.Model):
+    """
+    Per-month, per-plan membership figures, precomputed from memberships by
+    the snapshot_memberships job so analytics never read the live tables
+    """
+
+    TOTAL_FIELDS = [
+        "active_members",
+        "started",
+        "renewals",
+        "expiring",
+        "churned",
+    ]
+
+    class Meta:
+        db_table = "membership_monthly_snapshots"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["month", "plan_type"], name="membership_snapshot_month_uniq"
+            ),
+        ]
+
+    month = models.DateField(help_text="First day of the month summarised")
+    plan_type = models.CharField(
+        max_length=20,
+        choices=Membership.PlanChoices.choices,
+        help_text="Membership plan type summarised",
+    )
+    active_members = models.IntegerField(
+        default=0, help_text="Members holding this plan on the last day of the month"
+    )
+    started = models.IntegerField(
+        default=0, help_text="Memberships of this plan starting in the month"
+    )
+    renewals = models.IntegerField(
+        default=0,
+        help_text="Memberships starting in the month for members who had one before",
+    )
+    expiring = models.IntegerField(
+        default=0, help_text="Memberships of this plan ending in the month"
+    )
+    churned = models.IntegerField(
+        default=0,
+        help_text="Memberships ending in the month that no later membership follows",
+    )
+    computed_at = models.DateTimeField(
+        help_text="Date and time this snapshot was computed"
+    )
+
+    objects = MembershipMonthlySnapshotQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.plan_type} {self.month:%Y-%m}"
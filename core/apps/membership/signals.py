@@ -0,0 +1,12 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+
+from core.apps.membership.checkin.checkin import active_members
+from core.apps.membership.models import Membership
+
+
+@receiver(post_save, sender=Membership)
+@receiver(post_delete, sender=Membership)
+def refresh_checkin_member(sender, instance, raw=False, **kwargs):
+    if not raw:
+        active_members.refresh_member(instance.member_id)
@@ -1,3 +1,93 @@
-from django.test import TestCase
+import datetime
+import time
+from unittest import mock
 
-# Create your tests here.
+from django.test import TestCase, TransactionTestCase
+from rest_framework.test import APIClient
+
+from core.apps.membership.attendance.attendance import AttendanceBuffer
+from core.apps.membership.models import (
+    Attendance,
+    Membership,
+    MembershipMonthlySnapshot,
+)
+from core.apps.users.models import User
+
+
+class MembershipMonthlySnapshotTests(TestCase):
+    def test_refresh_replaces_the_month(self):
+        member = User.objects.create(username="member", role="member")
+        membership = Membership.objects.create(
+            member=member,
+            plan_type="basic",
+            start_date=datetime.date(2026, 9, 1),
+            end_date=datetime.date(2026, 9, 30),
+        )
+        month = datetime.date(2026, 9, 1)
+
+        MembershipMonthlySnapshot.objects.refresh([month])
+        MembershipMonthlySnapshot.objects.refresh([month])
+        snapshot = MembershipMonthlySnapshot.objects.get(month=month)
+        self.assertEqual(snapshot.plan_type, "basic")
+        self.assertEqual(snapshot.active_members, 1)
+
+        membership.plan_type = "yearly"
+        membership.save()
+        MembershipMonthlySnapshot.objects.refresh([month])
+        self.assertEqual(
+            list(
+                MembershipMonthlySnapshot.objects.filter(month=month).values_list(
+                    "plan_type", flat=True
+                )
+            ),
+            ["yearly"],
+        )
+
+
+class AttendanceBufferTests(TransactionTestCase):
+    def setUp(self):
+        self.member = User.objects.create(username="member", role="member")
+        self.buffer = AttendanceBuffer(max_records=100, max_delay_ms=50)
+
+    def wait_for_rows(self, count, timeout):
+        deadline = time.monotonic() + timeout
+        while time.monotonic() < deadline:
+            if Attendance.objects.count() >= count:
+                return True
+            time.sleep(0.005)
+        return False
+
+    def test_events_after_a_flush_are_written_within_max_delay(self):
+        self.buffer.record(self.member.id, "in")
+        self.assertTrue(self.wait_for_rows(1, timeout=1))
+
+        started = time.monotonic()
+        self.buffer.record(self.member.id, "out")
+        self.assertTrue(self.wait_for_rows(2, timeout=1))
+        # The delay clock starts at the first event; allow for scheduling.
+        self.assertLess(time.monotonic() - started, self.buffer.max_delay + 0.2)
+
+    def test_a_rejected_row_does_not_hold_back_the_batch(self):
+        self.buffer.record(self.member.id, "in")
+        self.buffer.record(self.member.id + 1000, "in")
+        self.buffer.record(self.member.id, "out")
+        self.buffer.flush()
+
+        self.assertEqual(
+            list(Attendance.objects.order_by("id").values_list("member_id", "event")),
+            [(self.member.id, "in"), (self.member.id, "out")],
+        )
+        self.assertEqual(self.buffer._pending, [])
+
+
+class CheckInViewTests(TestCase):
+    def test_unknown_member_is_not_recorded(self):
+        client = APIClient()
+        client.force_authenticate(User.objects.create(username="admin", role="admin"))
+        with mock.patch(
+            "core.apps.membership.views.attendance_buffer.record"
+        ) as record:
+            response = client.post("/check-in/999999/", {"event": "out"})
+
+        self.assertEqual(response.status_code, 404)
+        record.assert_not_called()
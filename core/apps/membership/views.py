@@ -1,74 +1,166 @@
+import datetime
+from collections import defaultdict
+
 from rest_framework import viewsets, status
+from rest_framework.decorators import action
 from rest_framework.response import Response
-from django.db.models import Q
+from rest_framework.views import APIView
+from django.db import IntegrityError, transaction
+from django.utils import timezone
+from django.utils.dateparse import parse_date
 from django.contrib.auth import get_user_model
 
+from core.apps.users.mixins.mixins import RoleScopedQuerysetMixin
 from core.apps.users.permissions.permissisons import (
     IsSuperAdmin,
     IsAdmin,
     IsTrainer,
     IsMember,
 )
-from core.apps.membership.models import Membership
+from core.apps.membership.attendance.attendance import attendance_buffer
+from core.apps.membership.checkin.checkin import active_members
+from core.apps.membership.models import (
+    ONE_ACTIVE_MEMBERSHIP,
+    Attendance,
+    Membership,
+    MembershipMonthlySnapshot,
+    month_start,
+    next_month,
+)
 from core.apps.membership.serializers.serializers import MembershipSerializer
 
 User = get_user_model()
 
 
-class MembershipViewSet(viewsets.ModelViewSet):
+class MembershipViewSet(RoleScopedQuerysetMixin, viewsets.ModelViewSet):
     serializer_class = MembershipSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
+    scope_super_admins = True
+    filter_fields = {
+        "member": "member",
+        "plan_type": "plan_type",
+        "is_active": "is_active",
+    }
+    range_filter_fields = {"end_date": "end_date"}
+    ordering_fields = ["id", "end_date"]
+    ordering = ["-id"]
 
     def get_queryset(self):
         """Return optimized queryset depending on user role."""
-        user = self.request.user
-        role = getattr(user, "role", None)
-
         # Optimize queryset with select_related for member (avoid N+1 queries)
-        base_qs = Membership.objects.select_related("member")
-
-        # SuperAdmin or Admin → full access
-        if getattr(user, "is_super", False) or role == "admin":
-            return base_qs
-
-        # Trainer → only memberships of assigned members
-        if role == "trainer":
-            from core.apps.workout.models import TrainerMember
-
-            member_ids = TrainerMember.objects.filter(
-                trainer=user, is_active=True, is_deleted=False
-            ).values_list("member_id", flat=True)
-            return base_qs.filter(member_id__in=member_ids)
-
-        # Member → only own memberships
-        if role == "member":
-            return base_qs.filter(member=user)
-
-        # No access by default
-        return Membership.objects.none()
+        return self.scope_queryset(Membership.objects.select_related("member"))
 
     def get_permissions(self):
         """Restrict create/update/delete to Admins/Trainers."""
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action == "analytics":
+            permission_classes = [IsSuperAdmin | IsAdmin]
+        elif self.action in ["create", "update", "partial_update", "destroy"]:
             permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
         else:
             permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
         return [permission() for permission in permission_classes]
 
-    def create(self, request, *args, **kwargs):
-        serializer = self.get_serializer(data=request.data)
-        serializer.is_valid(raise_exception=True)
-
-        member = serializer.validated_data["member"]
-
-        # Optimized existence check (only fetch ID)
-        if Membership.objects.filter(member=member, is_active=True).only("id").exists():
+    @action(detail=False, methods=["get"], url_path="analytics")
+    def analytics(self, request):
+        """
+        Active members, starts, renewals, expiries and churn per month and
+        plan type for ?from=YYYY-MM&to=YYYY-MM, read only from the monthly
+        snapshots. Churn rate is churned over the previous month's actives.
+        """
+        today = timezone.localdate()
+        try:
+            since = self._parse_month(request.query_params.get("from")) or (
+                month_start(today).replace(month=1)
+            )
+            until = self._parse_month(request.query_params.get("to")) or month_start(
+                today
+            )
+        except ValueError:
+            return Response(
+                {"error": "from and to must be months in YYYY-MM format."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if since > until:
             return Response(
-                {"error": "Member already has an active membership"},
+                {"error": "from must not be after to."},
                 status=status.HTTP_400_BAD_REQUEST,
             )
 
-        self.perform_create(serializer)
+        previous = month_start(since - datetime.timedelta(days=1))
+        snapshots = MembershipMonthlySnapshot.objects.filter(
+            month__gte=previous, month__lte=until
+        )
+        plan_type = request.query_params.get("plan_type")
+        if plan_type:
+            snapshots = snapshots.filter(plan_type=plan_type)
+        by_month = defaultdict(dict)
+        computed_at = None
+        for row in snapshots.values(
+            "month",
+            "plan_type",
+            "computed_at",
+            *MembershipMonthlySnapshot.TOTAL_FIELDS,
+        ):
+            row_computed_at = row.pop("computed_at")
+            computed_at = max(computed_at or row_computed_at, row_computed_at)
+            by_month[row.pop("month")][row.pop("plan_type")] = row
+
+        months = []
+        month = since
+        while month <= until:
+            plans = by_month.get(month, {})
+            totals = {
+                field: sum(plan[field] for plan in plans.values())
+                for field in MembershipMonthlySnapshot.TOTAL_FIELDS
+            }
+            previous_active = sum(
+                plan["active_members"] for plan in by_month.get(previous, {}).values()
+            )
+            totals["churn_rate"] = (
+                round(totals["churned"] / previous_active, 4)
+                if previous_active
+                else None
+            )
+            months.append(
+                {"month": month.strftime("%Y-%m"), "plans": plans, "totals": totals}
+            )
+            previous, month = month, next_month(month)
+
+        return Response({"computed_at": computed_at, "months": months})
+
+    @staticmethod
+    def _parse_month(value):
+        if not value:
+            return None
+        day = parse_date(f"{value}-01")
+        if day is None:
+            raise ValueError(value)
+        return day
+
+    def _save_guarded(self, serializer, error):
+        """
+        Save through the serializer, turning a violation of the one-active-
+        membership constraint into the API's 400 error
+        """
+        try:
+            with transaction.atomic():
+                serializer.save()
+        except IntegrityError as e:
+            if ONE_ACTIVE_MEMBERSHIP not in str(e):
+                raise
+            return Response({"error": error}, status=status.HTTP_400_BAD_REQUEST)
+        return None
+
+    def create(self, request, *args, **kwargs):
+        serializer = self.get_serializer(data=request.data)
+        serializer.is_valid(raise_exception=True)
+
+        # The database enforces one active membership per member.
+        error = self._save_guarded(
+            serializer, "Member already has an active membership"
+        )
+        if error:
+            return error
         headers = self.get_success_headers(serializer.data)
         return Response(
             serializer.data, status=status.HTTP_201_CREATED, headers=headers
@@ -80,20 +172,11 @@ class MembershipViewSet(viewsets.ModelViewSet):
         serializer = self.get_serializer(instance, data=request.data, partial=partial)
         serializer.is_valid(raise_exception=True)
 
-        # If activating membership → ensure no other active one exists
-        if request.data.get("is_active", False):
-            if (
-                Membership.objects.filter(member=instance.member, is_active=True)
-                .exclude(id=instance.id)
-                .only("id")
-                .exists()
-            ):
-                return Response(
-                    {"error": "Member already has another active membership"},
-                    status=status.HTTP_400_BAD_REQUEST,
-                )
-
-        self.perform_update(serializer)
+        error = self._save_guarded(
+            serializer, "Member already has another active membership"
+        )
+        if error:
+            return error
         return Response(serializer.data)
 
     def destroy(self, request, *args, **kwargs):
@@ -103,3 +186,76 @@ class MembershipViewSet(viewsets.ModelViewSet):
             instance.is_active = False
             instance.save(update_fields=["is_active"])
         return Response(status=status.HTTP_204_NO_CONTENT)
+
+
+class CheckInView(APIView):
+    """
+    Door-scanner check: does the member hold a membership covering today?
+    Answered from the in-process active member bitmap without SQL.
+    """
+
+    permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
+
+    def get(self, request, member_id):
+        return Response(
+            {"member": member_id, "active": active_members.is_active(member_id)}
+        )
+
+    def post(self, request, member_id):
+        """
+        Record a scan. Check-ins are only recorded for active members; events
+        are buffered and written in batches, hence 202.
+        """
+        event = request.data.get("event", "in")
+        if event not in dict(Attendance.EVENTS):
+            return Response(
+                {"error": "event must be 'in' or 'out'."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        active = active_members.is_active(member_id)
+        # Active members are known to exist; anyone else is looked up so an
+        # unknown id cannot reach the attendance buffer.
+        if not active and not User.objects.filter(pk=member_id).exists():
+            return Response(
+                {"error": "Member not found"}, status=status.HTTP_404_NOT_FOUND
+            )
+        recorded = active or event == "out"
+        if recorded:
+            attendance_buffer.record(
+                member_id, event, source=str(request.data.get("source", ""))[:50]
+            )
+        return Response(
+            {
+                "member": member_id,
+                "active": active,
+                "event": event,
+                "recorded": recorded,
+            },
+            status=status.HTTP_202_ACCEPTED if recorded else status.HTTP_200_OK,
+        )
+
+
+class OccupancyView(APIView):
+    """Members currently in the gym: today's latest event is a check-in"""
+
+    permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
+
+    def get(self, request):
+        present = list(
+            Attendance.objects.present()
+            .order_by("occurred_at")
+            .values("member_id", "member__username", "occurred_at")
+        )
+        return Response(
+            {
+                "count": len(present),
+                "members": [
+                    {
+                        "member": row["member_id"],
+                        "member_name": row["member__username"],
+                        "checked_in_at": row["occurred_at"],
+                    }
+                    for row in present
+                ],
+            }
+        )
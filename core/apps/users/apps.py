@@ -1,6 +1,13 @@
 from django.apps import AppConfig
+from django.core import checks
 
 
 class UsersConfig(AppConfig):
     default_auto_field = "django.db.models.BigAutoField"
     name = "core.apps.users"
+
+    def ready(self):
+        from core.apps.users import signals  # noqa: F401
+        from core.apps.users.caching.caching import check_shared_cache
+
+        checks.register(check_shared_cache, checks.Tags.caches, deploy=True)
@@ -0,0 +1,122 @@
+import threading
+import time
+from collections import OrderedDict
+
+from django.conf import settings
+from django.db import router
+from django.utils.translation import gettext_lazy as _
+from drf_spectacular.contrib.rest_framework_simplejwt import SimpleJWTScheme
+from rest_framework_simplejwt.authentication import JWTAuthentication
+from rest_framework_simplejwt.exceptions import AuthenticationFailed, InvalidToken
+from rest_framework_simplejwt.settings import api_settings
+
+
+class UserSnapshotCache:
+    """
+    Thread-safe, size-bounded LRU of user snapshots with a per-entry TTL.
+
+    Entries are invalidated explicitly when a user is saved or deleted in
+    this process; the TTL bounds how stale another process's copy can be.
+    """
+
+    def __init__(self, maxsize=1024, ttl=30):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            expires_at, snapshot = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return snapshot
+
+    def set(self, key, snapshot):
+        with self._lock:
+            self._entries[key] = (time.monotonic() + self.ttl, snapshot)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, key):
+        with self._lock:
+            self._entries.pop(key, None)
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+
+
+_cache_settings = getattr(settings, "AUTH_USER_CACHE", {})
+user_snapshot_cache = UserSnapshotCache(
+    maxsize=_cache_settings.get("MAXSIZE", 1024),
+    ttl=_cache_settings.get("TTL_SECONDS", 30),
+)
+
+
+class CachedJWTAuthentication(JWTAuthentication):
+    """
+    JWTAuthentication that resolves the token's user from an in-process
+    snapshot cache instead of loading the users row on every request.
+
+    The returned user only has the snapshot fields loaded; any other field is
+    fetched from the database on first access, and save() only writes the
+    loaded fields, so views that need more of the user still work.
+    """
+
+    snapshot_fields = ["id", "role", "is_super", "is_active", "is_deleted"]
+    cache = user_snapshot_cache
+
+    def get_snapshot_field_names(self):
+        # Model.from_db() expects values in the model's concrete field order.
+        return [
+            field.attname
+            for field in self.user_model._meta.concrete_fields
+            if field.attname in self.snapshot_fields
+        ]
+
+    def get_user(self, validated_token):
+        if api_settings.CHECK_REVOKE_TOKEN:
+            # The revoke check compares against the password hash, which the
+            # snapshot does not hold.
+            return super().get_user(validated_token)
+
+        try:
+            user_id = validated_token[api_settings.USER_ID_CLAIM]
+        except KeyError as e:
+            raise InvalidToken(
+                _("Token contained no recognizable user identification")
+            ) from e
+
+        # Tokens carry the id as a string; key the cache the same way.
+        user_id = str(user_id)
+        field_names = self.get_snapshot_field_names()
+        snapshot = self.cache.get(user_id)
+        if snapshot is None:
+            snapshot = (
+                self.user_model.objects.filter(**{api_settings.USER_ID_FIELD: user_id})
+                .values_list(*field_names)
+                .first()
+            )
+            if snapshot is None:
+                raise AuthenticationFailed(_("User not found"), code="user_not_found")
+            self.cache.set(user_id, snapshot)
+
+        user = self.user_model.from_db(
+            router.db_for_read(self.user_model), field_names, snapshot
+        )
+        if api_settings.CHECK_USER_IS_ACTIVE and not user.is_active:
+            raise AuthenticationFailed(_("User is inactive"), code="user_inactive")
+        return user
+
+
+class CachedJWTScheme(SimpleJWTScheme):
+    """Documents CachedJWTAuthentication as the same bearer scheme in the OpenAPI schema"""
+
+    target_class = CachedJWTAuthentication
@@ -0,0 +1,56 @@
+import time
+
+from django.conf import settings
+from django.core import checks
+from django.core.cache import cache
+from django.db import transaction
+
+VERSION_KEY = "refdata:{namespace}:version"
+
+
+def get_version(namespace):
+    """Current version of a reference data namespace, e.g. "exercises" """
+    key = VERSION_KEY.format(namespace=namespace)
+    version = cache.get(key)
+    if version is None:
+        # Seed from the clock so a cleared cache never reissues an old version
+        # (and with it a stale ETag).
+        cache.add(key, time.time_ns(), timeout=None)
+        version = cache.get(key)
+    return version
+
+
+def bump_version(namespace):
+    """Invalidate everything cached for `namespace` once the current transaction commits"""
+
+    def bump():
+        key = VERSION_KEY.format(namespace=namespace)
+        try:
+            cache.incr(key)
+        except ValueError:
+            cache.add(key, time.time_ns(), timeout=None)
+
+    # Bumping before commit would let a concurrent reader cache the old rows
+    # under the new version.
+    transaction.on_commit(bump)
+
+
+# Backends whose entries live in one process, so versions bumped by one
+# worker are never seen by the others.
+PROCESS_LOCAL_CACHES = {"django.core.cache.backends.locmem.LocMemCache"}
+
+
+def check_shared_cache(app_configs=None, **kwargs):
+    """Deploy check: versions and ETags need a cache shared by all workers"""
+    backend = settings.CACHES["default"]["BACKEND"]
+    if settings.DEBUG or backend not in PROCESS_LOCAL_CACHES:
+        return []
+    return [
+        checks.Error(
+            f"The default cache uses {backend}, which each worker process "
+            "keeps separately.",
+            hint="Set CACHE_BACKEND and CACHE_LOCATION to a shared cache "
+            "such as django.core.cache.backends.redis.RedisCache.",
+            id="users.E001",
+        )
+    ]
@@ -0,0 +1,165 @@
+import logging
+import queue
+import threading
+from io import BytesIO
+
+from django.core.files.base import ContentFile
+from django.core.files.storage import default_storage
+from django.db import close_old_connections, transaction
+from django.db.models.signals import post_save, pre_save
+from PIL import Image, ImageOps
+
+logger = logging.getLogger(__name__)
+
+# name: (max width, max height, JPEG quality)
+DERIVATIVE_SPECS = {
+    "thumb": (160, 160, 70),
+    "medium": (640, 640, 80),
+    "full": (1600, 1600, 85),
+}
+
+
+def derivatives_field(field_name):
+    """
+    Name of the CharField that records which upload of `field_name` has its
+    derivatives generated
+    """
+    return f"{field_name}_derivatives"
+
+
+def mark_derivatives_ready(model, pk, field_name, name):
+    """Record that `name` has derivatives, unless the field changed since"""
+    model._default_manager.filter(pk=pk, **{field_name: name}).update(
+        **{derivatives_field(field_name): name}
+    )
+
+
+def derivative_name(name, size):
+    """Storage path of one derivative of the original image `name`"""
+    # Keep the original extension so a.png and a.jpg do not collide.
+    return f"derivatives/{size}/{name}.jpg"
+
+
+def generate_derivatives(name, storage=default_storage):
+    """Write resized, recompressed JPEG copies of the stored image `name`"""
+    with storage.open(name, "rb") as original:
+        image = Image.open(original)
+        image = ImageOps.exif_transpose(image)
+        image.load()
+    if image.mode != "RGB":
+        image = image.convert("RGB")
+
+    for size, (width, height, quality) in DERIVATIVE_SPECS.items():
+        derivative = image.copy()
+        derivative.thumbnail((width, height), Image.Resampling.LANCZOS)
+        buffer = BytesIO()
+        derivative.save(
+            buffer, "JPEG", quality=quality, optimize=True, progressive=True
+        )
+        target = derivative_name(name, size)
+        if storage.exists(target):
+            storage.delete(target)
+        storage.save(target, ContentFile(buffer.getvalue()))
+
+
+def derivative_urls(field_file, derivatives_of, storage=default_storage):
+    """
+    URLs of each derivative of `field_file`, or of the original for every size
+    while the derivatives are still being generated. `derivatives_of` is the
+    value of the field's derivatives_field().
+    """
+    if not field_file:
+        return None
+    if field_file.name == derivatives_of:
+        return {
+            size: storage.url(derivative_name(field_file.name, size))
+            for size in DERIVATIVE_SPECS
+        }
+    return {size: field_file.url for size in DERIVATIVE_SPECS}
+
+
+class DerivativeQueue:
+    """
+    In-process work queue drained by a single daemon thread, so image
+    processing never runs on the request path. Jobs that are lost when the
+    process exits can be regenerated with the generate_image_derivatives
+    management command.
+    """
+
+    def __init__(self):
+        self._queue = queue.Queue()
+        self._lock = threading.Lock()
+        self._worker = None
+
+    def _ensure_worker(self):
+        with self._lock:
+            if self._worker is None or not self._worker.is_alive():
+                self._worker = threading.Thread(
+                    target=self._run, name="image-derivatives", daemon=True
+                )
+                self._worker.start()
+
+    def _run(self):
+        while True:
+            name, on_ready = self._queue.get()
+            try:
+                generate_derivatives(name)
+                if on_ready is not None:
+                    on_ready()
+            except Exception:
+                logger.exception("Could not generate derivatives for %s", name)
+            finally:
+                close_old_connections()
+                self._queue.task_done()
+
+    def enqueue(self, name, on_ready=None):
+        """
+        Queue `name` once the current transaction commits; `on_ready` is
+        called from the worker after its derivatives are written.
+        """
+
+        def put():
+            self._ensure_worker()
+            self._queue.put((name, on_ready))
+
+        transaction.on_commit(put)
+
+    def join(self):
+        self._queue.join()
+
+
+derivative_queue = DerivativeQueue()
+
+
+def track_image_fields(model, field_names, on_ready=None):
+    """
+    Connect save signals that queue derivative generation whenever one of
+    `field_names` on `model` receives a new upload. Each field needs a
+    companion derivatives_field(), which is set once the derivatives exist;
+    `on_ready` runs after that, e.g. to invalidate cached responses.
+    """
+
+    def mark_new_uploads(sender, instance, raw=False, **kwargs):
+        instance._new_image_fields = [
+            field_name
+            for field_name in field_names
+            if not raw
+            and getattr(instance, field_name)
+            and not getattr(instance, field_name)._committed
+        ]
+
+    def queue_new_uploads(sender, instance, **kwargs):
+        for field_name in getattr(instance, "_new_image_fields", ()):
+            name = getattr(instance, field_name).name
+
+            def ready(pk=instance.pk, field_name=field_name, name=name):
+                mark_derivatives_ready(model, pk, field_name, name)
+                if on_ready is not None:
+                    on_ready()
+
+            derivative_queue.enqueue(name, ready)
+        instance._new_image_fields = []
+
+    uid = f"image-derivatives-{model._meta.label_lower}"
+    pre_save.connect(mark_new_uploads, sender=model, weak=False, dispatch_uid=uid)
+    post_save.connect(queue_new_uploads, sender=model, weak=False, dispatch_uid=uid)
@@ -0,0 +1,57 @@
+from django.core.management.base import BaseCommand
+from django.db.models import F
+
+from core.apps.users.caching.caching import bump_version
+from core.apps.users.images.images import (
+    derivatives_field,
+    generate_derivatives,
+    mark_derivatives_ready,
+)
+from core.apps.users.models import User
+from core.apps.workout.models import Exercise, MemberProgress
+
+IMAGE_FIELDS = [
+    (User, "profile_image"),
+    (Exercise, "exercise_image"),
+    (MemberProgress, "progress_photos"),
+]
+
+
+class Command(BaseCommand):
+    help = "Generate thumb/medium/full derivatives for uploaded images"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--force",
+            action="store_true",
+            help="Regenerate derivatives that already exist",
+        )
+
+    def handle(self, *args, **options):
+        generated = failed = 0
+        for model, field_name in IMAGE_FIELDS:
+            images = model.objects.exclude(**{field_name: ""}).exclude(
+                **{f"{field_name}__isnull": True}
+            )
+            if not options["force"]:
+                images = images.exclude(
+                    **{derivatives_field(field_name): F(field_name)}
+                )
+            for pk, name in images.values_list("pk", field_name).iterator():
+                try:
+                    generate_derivatives(name)
+                except Exception as e:
+                    failed += 1
+                    self.stderr.write(f"{name}: {e}")
+                    continue
+                mark_derivatives_ready(model, pk, field_name, name)
+                generated += 1
+
+        if generated:
+            # Cached exercise lists embed the derivative URLs.
+            bump_version("exercises")
+        self.stdout.write(
+            self.style.SUCCESS(
+                f"Generated derivatives for {generated} images ({failed} failed)"
+            )
+        )
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:23
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0001_initial"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="trainermember",
+            index=models.Index(
+                fields=["trainer", "is_active", "is_deleted", "member"],
+                name="trainer_members_active_idx",
+            ),
+        ),
+    ]
@@ -0,0 +1,20 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:27
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("auth", "0012_alter_user_first_name_max_length"),
+        ("users", "0002_trainer_members_active_idx"),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="user",
+            index=models.Index(
+                fields=["role", "is_deleted"], name="users_role_deleted_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,24 @@
+# Generated by Django 5.2.6 on 2026-10-17 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("users", "0003_list_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="user",
+            name="profile_image_derivatives",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Upload whose thumb/medium/full derivatives have been generated",
+                max_length=100,
+            ),
+        ),
+    ]
@@ -0,0 +1,188 @@
+import csv
+import hashlib
+import json
+
+from django.core.cache import cache
+from django.core.serializers.json import DjangoJSONEncoder
+from django.db.models import Exists, OuterRef
+from django.http import HttpResponse, StreamingHttpResponse
+from django.utils.cache import patch_cache_control
+from django.utils.http import parse_etags
+from rest_framework import status
+from rest_framework.decorators import action
+from rest_framework.renderers import JSONRenderer
+from rest_framework.response import Response
+
+from core.apps.users.caching.caching import get_version
+from core.apps.users.models import TrainerMember
+
+
+class _Echo:
+    """File-like object whose write() hands the line back to the csv writer caller"""
+
+    def write(self, value):
+        return value
+
+
+class StreamingExportMixin:
+    """
+    Adds a `GET <prefix>/export/` action that streams every row of the
+    viewset's (role-scoped, filtered) queryset as NDJSON or CSV.
+
+    Rows are read as `values_list()` tuples in primary-key order, one keyset
+    batch of `export_chunk_size` rows at a time, so memory stays flat no
+    matter how many rows are exported. MySQL drivers buffer a whole result
+    set client side, which rules out a single long-running `iterator()`.
+    Viewsets set `export_fields` to the `values()` lookups to include.
+    """
+
+    export_fields = None
+    export_filename = "export"
+    export_chunk_size = 2000
+    export_format_query_param = "output"
+    export_formats = {
+        "ndjson": "application/x-ndjson",
+        "csv": "text/csv",
+    }
+
+    def get_export_queryset(self):
+        return self.filter_queryset(self.get_queryset())
+
+    def iter_export_rows(self, queryset):
+        queryset = queryset.order_by().values_list("pk", *self.export_fields)
+        last_pk = None
+        while True:
+            batch = queryset
+            if last_pk is not None:
+                batch = batch.filter(pk__gt=last_pk)
+            rows = list(batch.order_by("pk")[: self.export_chunk_size])
+            if not rows:
+                return
+            for row in rows:
+                yield row[1:]
+            last_pk = rows[-1][0]
+
+    def render_ndjson(self, rows):
+        for row in rows:
+            yield json.dumps(dict(zip(self.export_fields, row)), cls=DjangoJSONEncoder)
+            yield "\n"
+
+    def render_csv(self, rows):
+        writer = csv.writer(_Echo())
+        yield writer.writerow(self.export_fields)
+        for row in rows:
+            yield writer.writerow(row)
+
+    @action(detail=False, methods=["get"], url_path="export")
+    def export(self, request):
+        """Stream all rows visible to the current user as NDJSON or CSV"""
+        export_format = request.query_params.get(
+            self.export_format_query_param, "ndjson"
+        )
+        if export_format not in self.export_formats:
+            return Response(
+                {
+                    "error": f"Unsupported export format. Choose one of: {', '.join(self.export_formats)}."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        rows = self.iter_export_rows(self.get_export_queryset())
+        render = getattr(self, f"render_{export_format}")
+        response = StreamingHttpResponse(
+            render(rows), content_type=self.export_formats[export_format]
+        )
+        response["Content-Disposition"] = (
+            f'attachment; filename="{self.export_filename}.{export_format}"'
+        )
+        return response
+
+
+class RoleScopedQuerysetMixin:
+    """
+    Restricts a viewset's queryset to the rows the current user may see.
+
+    Admins see everything, members see their own rows and trainers see the
+    rows of their actively assigned members. The trainer case is a
+    correlated EXISTS on trainer_members rather than an IN-list of member
+    ids, so it stays a single query however many members a trainer has.
+    Viewsets set `scope_member_field` to the field pointing at the member,
+    set `scope_super_admins` if super admins see everything too, and call
+    `scope_queryset()` from `get_queryset()`.
+    """
+
+    scope_member_field = "member"
+    scope_super_admins = False
+
+    def scope_queryset(self, queryset):
+        user = self.request.user
+        role = getattr(user, "role", None)
+        if role == "admin":
+            return queryset
+        if self.scope_super_admins and getattr(user, "is_super", False):
+            return queryset
+        if role == "trainer":
+            return queryset.filter(
+                Exists(
+                    TrainerMember.objects.active_for(user).filter(
+                        member_id=OuterRef(f"{self.scope_member_field}_id")
+                    )
+                )
+            )
+        if role == "member":
+            return queryset.filter(**{self.scope_member_field: user})
+        return queryset.none()
+
+    def get_trainer_member_ids(self):
+        """
+        The ids of the current trainer's active members, fetched once per
+        request for checks done in Python.
+        """
+        request = self.request
+        if not hasattr(request, "_trainer_member_ids"):
+            request._trainer_member_ids = frozenset(
+                TrainerMember.objects.active_for(request.user).values_list(
+                    "member_id", flat=True
+                )
+            )
+        return request._trainer_member_ids
+
+
+class VersionedListCacheMixin:
+    """
+    Serves `list` for slowly changing reference data from a pre-rendered JSON
+    cache with strong ETags.
+
+    Every cached body and ETag is keyed on the namespace's version counter
+    (see caching.bump_version) and the request's query string, so a
+    conditional GET that still matches is answered with 304 without touching
+    the database or a serializer. The list must look the same to every user
+    allowed to call it. Viewsets set `list_cache_namespace`.
+    """
+
+    list_cache_namespace = None
+    list_cache_timeout = 60 * 60 * 24
+
+    def get_list_cache_key(self, request):
+        version = get_version(self.list_cache_namespace)
+        query = request.GET.urlencode()
+        digest = hashlib.sha1(query.encode()).hexdigest()[:16]
+        return f"refdata:{self.list_cache_namespace}:{version}:{digest}"
+
+    def list(self, request, *args, **kwargs):
+        key = self.get_list_cache_key(request)
+        etag = f'"{hashlib.sha1(key.encode()).hexdigest()}"'
+
+        if etag in parse_etags(request.headers.get("If-None-Match", "")):
+            response = HttpResponse(status=status.HTTP_304_NOT_MODIFIED)
+        else:
+            body = cache.get(key)
+            if body is None:
+                data = super().list(request, *args, **kwargs).data
+                body = JSONRenderer().render(data)
+                cache.set(key, body, self.list_cache_timeout)
+            response = HttpResponse(body, content_type="application/json")
+
+        response["ETag"] = etag
+        patch_cache_control(response, private=True, no_cache=True)
+        return response
@@ -5,6 +5,10 @@ from django.contrib.auth.models import AbstractUser
 class User(AbstractUser):
     class Meta:
         db_table = "users"
+        indexes = [
+            # Role-scoped user listings filter on both columns.
+            models.Index(fields=["role", "is_deleted"], name="users_role_deleted_idx"),
+        ]
 
     class GenderChoices(models.TextChoices):
         MALE = "male"
@@ -49,6 +53,13 @@ class User(AbstractUser):
         null=True,
         help_text="User's profile picture",
     )
+    profile_image_derivatives = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Upload whose thumb/medium/full derivatives have been generated",
+    )
     is_deleted = models.BooleanField(
         default=False, help_text="Soft delete flag for this user"
     )
@@ -57,10 +68,24 @@ class User(AbstractUser):
     )
 
 
+class TrainerMemberQuerySet(models.QuerySet):
+    def active_for(self, trainer):
+        """Assignments that currently give `trainer` access to a member"""
+        return self.filter(trainer=trainer, is_active=True, is_deleted=False)
+
+
 class TrainerMember(models.Model):
     class Meta:
         db_table = "trainer_members"
         unique_together = ("trainer", "member")
+        indexes = [
+            # Serves active_for() lookups and, with member_id last, the
+            # role-scoping EXISTS subqueries from the index alone.
+            models.Index(
+                fields=["trainer", "is_active", "is_deleted", "member"],
+                name="trainer_members_active_idx",
+            ),
+        ]
 
     trainer = models.ForeignKey(
         User,
@@ -91,3 +116,5 @@ class TrainerMember(models.Model):
     is_deleted = models.BooleanField(
         default=False, help_text="Soft delete flag for this assignment"
     )
+
+    objects = TrainerMemberQuerySet.as_manager()
@@ -0,0 +1,151 @@
+import base64
+import binascii
+
+from django.core.exceptions import ValidationError
+from django.db.models import Q
+from rest_framework.exceptions import NotFound
+from rest_framework.pagination import BasePagination, PageNumberPagination
+from rest_framework.response import Response
+from rest_framework.utils.urls import remove_query_param, replace_query_param
+
+
+class StandardPagination(PageNumberPagination):
+    """
+    Project-wide default: numbered pages with a client-selectable, capped
+    page size. Viewsets over append-heavy tables use KeysetPagination instead.
+    """
+
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+
+
+class KeysetPagination(BasePagination):
+    """
+    Cursor pagination keyed on a (value, id) pair, newest first.
+
+    Each page is fetched with a `WHERE (key, id) < (cursor)` seek instead of an
+    OFFSET, so the cost of a page does not grow with its depth. Subclasses set
+    `keyset_field` to a column that is backed by an index ending in
+    (keyset_field, id).
+    """
+
+    keyset_field = None
+    cursor_query_param = "cursor"
+    page_size = 50
+    page_size_query_param = "page_size"
+    max_page_size = 500
+    invalid_cursor_message = "Invalid cursor"
+
+    def paginate_queryset(self, queryset, request, view=None):
+        self.request = request
+        self.page_size = self.get_page_size(request)
+
+        queryset = queryset.order_by(f"-{self.keyset_field}", "-id")
+        cursor = self.decode_cursor(request, queryset)
+        if cursor is not None:
+            value, pk = cursor
+            queryset = queryset.filter(
+                Q(**{f"{self.keyset_field}__lt": value})
+                | Q(**{self.keyset_field: value, "id__lt": pk})
+            )
+
+        # Fetch one extra row to learn whether another page exists.
+        results = list(queryset[: self.page_size + 1])
+        self.has_next = len(results) > self.page_size
+        results = results[: self.page_size]
+
+        self.next_cursor = None
+        if self.has_next:
+            last = results[-1]
+            self.next_cursor = self.encode_cursor(
+                getattr(last, self.keyset_field), last.pk
+            )
+        return results
+
+    def get_page_size(self, request):
+        try:
+            page_size = int(request.query_params[self.page_size_query_param])
+        except (KeyError, ValueError):
+            return self.page_size
+        if page_size <= 0:
+            return self.page_size
+        return min(page_size, self.max_page_size)
+
+    def encode_cursor(self, value, pk):
+        raw = f"{value.isoformat() if hasattr(value, 'isoformat') else value}|{pk}"
+        return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+    def decode_cursor(self, request, queryset):
+        """
+        Return the cursor as a (value, id) pair parsed with the keyset field,
+        so a tampered cursor is a 404 rather than a database error.
+        """
+        encoded = request.query_params.get(self.cursor_query_param)
+        if not encoded:
+            return None
+        field = queryset.model._meta.get_field(self.keyset_field)
+        try:
+            raw = base64.urlsafe_b64decode(encoded.encode("ascii")).decode("ascii")
+            value, pk = raw.rsplit("|", 1)
+            value = field.to_python(value)
+            pk = int(pk)
+        except (binascii.Error, UnicodeError, ValueError, ValidationError):
+            raise NotFound(self.invalid_cursor_message)
+        if value is None:
+            raise NotFound(self.invalid_cursor_message)
+        return value, pk
+
+    def get_next_link(self):
+        if self.next_cursor is None:
+            return None
+        url = self.request.build_absolute_uri()
+        return replace_query_param(url, self.cursor_query_param, self.next_cursor)
+
+    def get_first_link(self):
+        url = self.request.build_absolute_uri()
+        return remove_query_param(url, self.cursor_query_param)
+
+    def get_paginated_response(self, data):
+        return Response(
+            {
+                "next": self.get_next_link(),
+                "first": self.get_first_link(),
+                "results": data,
+            }
+        )
+
+    def get_paginated_response_schema(self, schema):
+        return {
+            "type": "object",
+            "required": ["results"],
+            "properties": {
+                "next": {"type": "string", "nullable": True, "format": "uri"},
+                "first": {"type": "string", "format": "uri"},
+                "results": schema,
+            },
+        }
+
+    def get_schema_operation_parameters(self, view):
+        return [
+            {
+                "name": self.cursor_query_param,
+                "required": False,
+                "in": "query",
+                "description": "Opaque cursor returned as `next` by the previous page.",
+                "schema": {"type": "string"},
+            },
+            {
+                "name": self.page_size_query_param,
+                "required": False,
+                "in": "query",
+                "description": f"Number of results per page (max {self.max_page_size}).",
+                "schema": {"type": "integer"},
+            },
+        ]
+
+
+class WorkoutLogCursorPagination(KeysetPagination):
+    """Pages workout logs by (date, id), served by the workout_logs member/date index."""
+
+    keyset_field = "date"
@@ -0,0 +1,72 @@
+import logging
+import threading
+
+from django.db import close_old_connections
+
+logger = logging.getLogger(__name__)
+
+
+class PeriodicJob:
+    """
+    Runs `func` every `interval` seconds on a daemon thread, starting
+    `initial_delay` seconds after start(). Failures are logged and the job
+    keeps its schedule. Every worker process that starts a job runs it, so
+    jobs must be safe to run concurrently.
+    """
+
+    def __init__(self, name, func, interval, initial_delay=0):
+        self.name = name
+        self.func = func
+        self.interval = interval
+        self.initial_delay = initial_delay
+        self._stopped = threading.Event()
+        self._thread = None
+
+    def _run(self):
+        delay = self.initial_delay
+        while not self._stopped.wait(delay):
+            try:
+                self.func()
+            except Exception:
+                logger.exception("Scheduled job %s failed", self.name)
+            finally:
+                # The thread keeps its own connection between runs.
+                close_old_connections()
+            delay = self.interval
+
+    def start(self):
+        if self._thread is None or not self._thread.is_alive():
+            self._stopped.clear()
+            self._thread = threading.Thread(
+                target=self._run, name=f"scheduler-{self.name}", daemon=True
+            )
+            self._thread.start()
+
+    def stop(self):
+        self._stopped.set()
+
+
+class Scheduler:
+    """Registry of the process's periodic jobs, each started at most once"""
+
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._jobs = {}
+
+    def schedule(self, name, func, interval, initial_delay=0):
+        with self._lock:
+            job = self._jobs.get(name)
+            if job is None:
+                job = self._jobs[name] = PeriodicJob(
+                    name, func, interval, initial_delay
+                )
+            job.start()
+            return job
+
+    def stop(self):
+        with self._lock:
+            for job in self._jobs.values():
+                job.stop()
+
+
+scheduler = Scheduler()
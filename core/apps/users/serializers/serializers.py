@@ -1,9 +1,34 @@
 from rest_framework import serializers
+from rest_framework_simplejwt.serializers import TokenObtainPairSerializer
+from core.apps.users.images.images import derivative_urls, derivatives_field
 from core.apps.users.models import User, TrainerMember
 
 
+class DerivativeURLsField(serializers.ReadOnlyField):
+    """
+    Exposes the thumb/medium/full derivative URLs of an image field; every
+    size points at the original until the derivatives have been generated.
+    """
+
+    def get_attribute(self, instance):
+        return (
+            super().get_attribute(instance),
+            getattr(instance, derivatives_field(self.source)),
+        )
+
+    def to_representation(self, value):
+        urls = derivative_urls(*value)
+        if urls is None:
+            return None
+        request = self.context.get("request")
+        if request is not None:
+            urls = {size: request.build_absolute_uri(url) for size, url in urls.items()}
+        return urls
+
+
 class UserSerializer(serializers.ModelSerializer):
     password = serializers.CharField(write_only=True, min_length=8)
+    profile_image_urls = DerivativeURLsField(source="profile_image")
 
     class Meta:
         model = User
@@ -21,6 +46,7 @@ class UserSerializer(serializers.ModelSerializer):
             "height",
             "age",
             "profile_image",
+            "profile_image_urls",
             "phone",
             "is_deleted",
         ]
@@ -125,3 +151,16 @@ class SelfAPISerilizer(serializers.ModelSerializer):
             "username",
             "role",
         ]
+
+
+class SelfTokenObtainPairSerializer(TokenObtainPairSerializer):
+    """Embeds the SelfDetails fields as token claims so /self/ can skip the database"""
+
+    self_claims = ["username", "role"]
+
+    @classmethod
+    def get_token(cls, user):
+        token = super().get_token(user)
+        for claim in cls.self_claims:
+            token[claim] = getattr(user, claim)
+        return token
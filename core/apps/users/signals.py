@@ -0,0 +1,17 @@
+from django.db.models.signals import post_delete, post_save
+from django.dispatch import receiver
+from rest_framework_simplejwt.settings import api_settings
+
+from core.apps.users.authentication.authentication import user_snapshot_cache
+from core.apps.users.images.images import track_image_fields
+from core.apps.users.models import User
+
+
+@receiver(post_save, sender=User)
+@receiver(post_delete, sender=User)
+def invalidate_user_snapshot(sender, instance, **kwargs):
+    """Drop the cached auth snapshot when a user is saved, soft-deleted or restored"""
+    user_snapshot_cache.invalidate(str(getattr(instance, api_settings.USER_ID_FIELD)))
+
+
+track_image_fields(User, ["profile_image"])
@@ -1 +1,127 @@
-# from django.test import TestCase
+import base64
+import datetime
+import tempfile
+from io import BytesIO
+from unittest import mock
+
+from django.core.files.storage import default_storage
+from django.core.files.uploadedfile import SimpleUploadedFile
+from django.test import TestCase, TransactionTestCase, override_settings
+from PIL import Image
+from rest_framework.test import APIClient
+
+from core.apps.users.caching.caching import check_shared_cache
+from core.apps.users.images.images import derivative_queue
+from core.apps.users.models import User
+from core.apps.users.serializers.serializers import UserSerializer
+from core.apps.membership.models import Membership
+from core.apps.workout.models import Exercise, WorkoutLog
+
+
+def cursor(raw):
+    return base64.urlsafe_b64encode(raw.encode("ascii")).decode("ascii")
+
+
+class KeysetPaginationTests(TestCase):
+    def setUp(self):
+        self.client = APIClient()
+        self.client.force_authenticate(
+            User.objects.create(username="admin", role="admin")
+        )
+
+    def test_malformed_cursor_is_not_found(self):
+        for raw in ("2026-13-45|1", "yesterday|1", "2026-03-01|x", "|1", "nocursor"):
+            with self.subTest(raw=raw):
+                response = self.client.get("/workout-logs/", {"cursor": cursor(raw)})
+                self.assertEqual(response.status_code, 404)
+
+        response = self.client.get("/workout-logs/", {"cursor": "%%%"})
+        self.assertEqual(response.status_code, 404)
+
+    def test_well_formed_cursor_pages(self):
+        response = self.client.get("/workout-logs/", {"cursor": cursor("2026-03-01|1")})
+        self.assertEqual(response.status_code, 200)
+        self.assertEqual(response.json()["results"], [])
+
+
+class ImageDerivativeTests(TransactionTestCase):
+    def setUp(self):
+        media_root = tempfile.TemporaryDirectory()
+        self.addCleanup(media_root.cleanup)
+        settings = override_settings(MEDIA_ROOT=media_root.name)
+        settings.enable()
+        self.addCleanup(settings.disable)
+
+    def upload(self):
+        buffer = BytesIO()
+        Image.new("RGB", (800, 600), "red").save(buffer, "PNG")
+        return SimpleUploadedFile("face.png", buffer.getvalue())
+
+    def test_derivative_urls_follow_the_recorded_state(self):
+        user = User.objects.create(
+            username="member", role="member", profile_image=self.upload()
+        )
+        derivative_queue.join()
+        user.refresh_from_db()
+        self.assertEqual(user.profile_image_derivatives, user.profile_image.name)
+
+        with mock.patch.object(default_storage, "exists") as exists:
+            urls = UserSerializer(user).data["profile_image_urls"]
+        exists.assert_not_called()
+        self.assertIn("derivatives/thumb/", urls["thumb"])
+
+        user.profile_image = self.upload()
+        self.assertEqual(
+            set(UserSerializer(user).data["profile_image_urls"].values()),
+            {user.profile_image.url},
+        )
+
+
+class SharedCacheCheckTests(TestCase):
+    def caches(self, backend):
+        return {"default": {"BACKEND": backend, "LOCATION": ""}}
+
+    def test_process_local_cache_fails_outside_debug(self):
+        locmem = self.caches("django.core.cache.backends.locmem.LocMemCache")
+        redis = self.caches("django.core.cache.backends.redis.RedisCache")
+
+        with override_settings(DEBUG=False, CACHES=locmem):
+            self.assertEqual([e.id for e in check_shared_cache()], ["users.E001"])
+        with override_settings(DEBUG=True, CACHES=locmem):
+            self.assertEqual(check_shared_cache(), [])
+        with override_settings(DEBUG=False, CACHES=redis):
+            self.assertEqual(check_shared_cache(), [])
+
+
+class RoleScopedQuerysetTests(TestCase):
+    def setUp(self):
+        member = User.objects.create(username="member", role="member")
+        exercise = Exercise.objects.create(
+            name="Squat", category="legs", muscle_groups="legs"
+        )
+        WorkoutLog.objects.create(
+            member=member, exercise=exercise, sets_completed=3, reps_completed=5
+        )
+        Membership.objects.create(
+            member=member,
+            plan_type="basic",
+            start_date=datetime.date(2026, 9, 1),
+            end_date=datetime.date(2026, 9, 30),
+        )
+        self.client = APIClient()
+
+    def count(self, user, url):
+        self.client.force_authenticate(user)
+        response = self.client.get(url)
+        self.assertEqual(response.status_code, 200)
+        return len(response.json()["results"])
+
+    def test_only_admins_are_unscoped_unless_the_viewset_opts_in(self):
+        admin = User.objects.create(username="admin", role="admin")
+        super_admin = User.objects.create(
+            username="superadmin", role="superadmin", is_super=True
+        )
+
+        self.assertEqual(self.count(admin, "/workout-logs/"), 1)
+        self.assertEqual(self.count(super_admin, "/workout-logs/"), 0)
+        self.assertEqual(self.count(super_admin, "/memberships/"), 1)
@@ -10,6 +10,7 @@ from core.apps.users.models import TrainerMember, User
 from core.apps.users.serializers.serializers import (
     LogoutSerializer,
     SelfAPISerilizer,
+    SelfTokenObtainPairSerializer,
     TrainerMemberSerializer,
     UserSerializer,
 )
@@ -18,6 +19,9 @@ from core.apps.users.serializers.serializers import (
 class UserViewSet(viewsets.ModelViewSet):
     serializer_class = UserSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
+    filter_fields = {"role": "role"}
+    ordering_fields = ["id", "username"]
+    ordering = ["id"]
 
     def get_queryset(self):
         user = self.request.user
@@ -138,20 +142,26 @@ class UserViewSet(viewsets.ModelViewSet):
     def list(self, request, *args, **kwargs):
         """List all non-deleted users"""
         queryset = self.filter_queryset(self.get_queryset())
-        serializer = self.get_serializer(queryset, many=True)
-        return Response(
-            {"message": "Users retrieved successfully", "users": serializer.data},
-            status=status.HTTP_200_OK,
-        )
+        return self.get_user_page_response(queryset, "Users retrieved successfully")
 
     @action(detail=False, methods=["get"])
     def deleted_users(self, request):
         """Get all deleted users"""
-        deleted_users = User.objects.filter(is_deleted=True)
-        serializer = self.get_serializer(deleted_users, many=True)
+        deleted_users = self.filter_queryset(User.objects.filter(is_deleted=True))
+        return self.get_user_page_response(
+            deleted_users, "Deleted users retrieved successfully"
+        )
+
+    def get_user_page_response(self, queryset, message):
+        """Paginate users while keeping the message/users response envelope"""
+        page = self.paginate_queryset(queryset)
+        serializer = self.get_serializer(page, many=True)
         return Response(
             {
-                "message": "Deleted users retrieved successfully",
+                "message": message,
+                "count": self.paginator.page.paginator.count,
+                "next": self.paginator.get_next_link(),
+                "previous": self.paginator.get_previous_link(),
                 "users": serializer.data,
             },
             status=status.HTTP_200_OK,
@@ -199,6 +209,13 @@ class TrainerMemberViewSet(viewsets.ModelViewSet):
     serializer_class = TrainerMemberSerializer
     # default class (kept for readability) — we'll return instances in get_permissions
     permission_classes = [IsAdmin | IsSuperAdmin]
+    filter_fields = {
+        "trainer": "trainer",
+        "member": "member",
+        "is_active": "is_active",
+    }
+    ordering_fields = ["id"]
+    ordering = ["id"]
 
     def get_permissions(self):
         """
@@ -239,9 +256,31 @@ class TrainerMemberViewSet(viewsets.ModelViewSet):
 class SelfDetails(ListAPIView):
     queryset = User.objects.all()
     serializer_class = SelfAPISerilizer
+    fresh_query_param = "fresh"
+
+    def get_token_details(self, request):
+        """Read the SelfDetails fields from the access token, if it carries them"""
+        token = request.auth
+        if token is None:
+            return None
+        claims = SelfTokenObtainPairSerializer.self_claims
+        if any(claim not in token for claim in claims):
+            # Tokens issued before the claims were added
+            return None
+        data = {"id": request.user.id}
+        data.update({claim: token[claim] for claim in claims})
+        return data
 
     def list(self, request, *args, **kwargs):
         try:
+            if request.query_params.get(self.fresh_query_param) not in (
+                "1",
+                "true",
+            ):
+                data = self.get_token_details(request)
+                if data is not None:
+                    return Response(data)
+
             user = self.queryset.filter(id=request.user.id).first()
             if not user:
                 return Response(
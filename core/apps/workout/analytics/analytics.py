@@ -0,0 +1,193 @@
+import numpy as np
+from django.core.cache import cache
+from django.db.models import Max
+
+from core.apps.users.caching.caching import bump_version, get_version
+from core.apps.workout.models import WorkoutLog
+
+CACHE_TIMEOUT = 60 * 60 * 24
+LOG_COLUMNS = [
+    "member_id",
+    "exercise_id",
+    "exercise__name",
+    "date",
+    "sets_completed",
+    "reps_completed",
+    "weight_used",
+]
+
+
+def estimated_one_rep_max(weight, reps):
+    """Epley estimate; a single rep is the weight itself"""
+    return np.where(reps <= 1, weight, weight * (1 + reps / 30.0))
+
+
+def week_start(days):
+    """Monday of the week for day numbers counted from 1970-01-01 (a Thursday)"""
+    return days - (days + 3) % 7
+
+
+def segmented_running_max(values, segments):
+    """
+    Running maximum of non-negative `values` that restarts whenever
+    `segments` (sorted ascending) changes.
+    """
+    if not len(values):
+        return values
+    offset = float(np.nanmax(values)) + 1.0
+    shifted = segments * offset + np.nan_to_num(values)
+    return np.maximum.accumulate(shifted) - segments * offset
+
+
+def _namespace(member_id):
+    return f"training-analytics:{member_id}"
+
+
+def invalidate_training_analytics(*member_ids):
+    """Drop the cached reports of `member_ids` once the transaction commits"""
+    for member_id in set(member_ids):
+        if member_id is not None:
+            bump_version(_namespace(member_id))
+
+
+def _as_date(day):
+    return np.datetime64(int(day), "D").astype(object).isoformat()
+
+
+def _load_columns(member_ids):
+    """All logs of `member_ids` as NumPy columns, from a single query"""
+    rows = list(
+        WorkoutLog.objects.filter(member_id__in=member_ids)
+        .order_by("member_id", "exercise_id", "date", "id")
+        .values_list(*LOG_COLUMNS)
+    )
+    if not rows:
+        return None
+    member, exercise, name, date, sets, reps, weight = zip(*rows)
+    return {
+        "member": np.asarray(member, dtype=np.int64),
+        "exercise": np.asarray(exercise, dtype=np.int64),
+        "name": np.asarray(name, dtype=object),
+        "day": np.asarray(date, dtype="datetime64[D]").astype(np.int64),
+        "sets": np.asarray(sets, dtype=np.float64),
+        "reps": np.asarray(reps, dtype=np.float64),
+        # Bodyweight entries (no weight, or zero) are left out of 1RM/intensity.
+        "weight": np.asarray(
+            [np.nan if w is None or w <= 0 else w for w in weight], dtype=np.float64
+        ),
+    }
+
+
+def _member_report(cols, rows):
+    """Analytics for one member's contiguous `rows` slice of the columns"""
+    member = {key: value[rows] for key, value in cols.items()}
+    weeks = week_start(member["day"])
+    weighted = ~np.isnan(member["weight"])
+
+    tonnage = member["sets"] * member["reps"] * np.nan_to_num(member["weight"])
+    tonnage_weeks, inverse = np.unique(weeks, return_inverse=True)
+    weekly_tonnage = np.bincount(inverse, weights=tonnage)
+
+    e1rm = estimated_one_rep_max(member["weight"], member["reps"])
+    running_best = segmented_running_max(e1rm, member["exercise"])
+    intensity = np.divide(
+        member["weight"],
+        running_best,
+        out=np.full_like(running_best, np.nan),
+        where=running_best > 0,
+    )
+
+    # Rows are sorted by exercise, so each exercise is one contiguous run.
+    exercise_ids, starts = np.unique(member["exercise"], return_index=True)
+    ends = np.append(starts[1:], len(member["exercise"]))
+    exercises = []
+    for exercise_id, start, end in zip(exercise_ids, starts, ends):
+        run = slice(start, end)
+        keep = weighted[run]
+        if not keep.any():
+            continue
+        days, day_index = np.unique(member["day"][run][keep], return_inverse=True)
+        daily_best = np.full(len(days), -np.inf)
+        np.maximum.at(daily_best, day_index, e1rm[run][keep])
+
+        ex_weeks, week_index = np.unique(weeks[run][keep], return_inverse=True)
+        sets = member["sets"][run][keep]
+        week_intensity = np.bincount(
+            week_index, weights=intensity[run][keep] * sets
+        ) / np.bincount(week_index, weights=sets)
+
+        exercises.append(
+            {
+                "exercise": int(exercise_id),
+                "exercise_name": member["name"][start],
+                "estimated_1rm": round(float(daily_best.max()), 2),
+                "e1rm_curve": [
+                    {"date": _as_date(day), "e1rm": round(float(value), 2)}
+                    for day, value in zip(days, daily_best)
+                ],
+                "intensity_curve": [
+                    {"week": _as_date(week), "intensity": round(float(value), 3)}
+                    for week, value in zip(ex_weeks, week_intensity)
+                ],
+            }
+        )
+
+    return {
+        "weekly_tonnage": [
+            {"week": _as_date(week), "tonnage": round(float(value), 2)}
+            for week, value in zip(tonnage_weeks, weekly_tonnage)
+        ],
+        "exercises": exercises,
+    }
+
+
+def training_analytics(member_ids):
+    """
+    Per-member e1RM curves, weekly tonnage and intensity curves.
+
+    Results are cached per member until one of their logs or any exercise
+    changes; all cache misses are computed together from one query.
+    """
+    last_log_ids = dict(
+        WorkoutLog.objects.filter(member_id__in=member_ids)
+        .values_list("member_id")
+        .annotate(last_log_id=Max("id"))
+        .order_by()
+    )
+    exercises_version = get_version("exercises")
+    keys = {
+        member_id: ":".join(
+            [
+                _namespace(member_id),
+                str(get_version(_namespace(member_id))),
+                str(exercises_version),
+            ]
+        )
+        for member_id in member_ids
+        if member_id in last_log_ids
+    }
+    reports = {}
+    cached = cache.get_many(keys.values())
+    for member_id, key in keys.items():
+        if key in cached:
+            reports[member_id] = cached[key]
+
+    missing = [member_id for member_id in keys if member_id not in reports]
+    if missing:
+        cols = _load_columns(missing)
+        fresh = {}
+        for member_id in missing:
+            start, end = np.searchsorted(cols["member"], [member_id, member_id + 1])
+            report = _member_report(cols, slice(start, end))
+            reports[member_id] = fresh[keys[member_id]] = report
+        cache.set_many(fresh, CACHE_TIMEOUT)
+
+    empty = {"weekly_tonnage": [], "exercises": []}
+    return [
+        {
+            "member": member_id,
+            "last_log_id": last_log_ids.get(member_id),
+            **reports.get(member_id, empty),
+        }
+        for member_id in member_ids
+    ]
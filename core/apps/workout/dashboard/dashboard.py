@@ -0,0 +1,132 @@
+import datetime
+
+from django.core.cache import cache
+from django.db.models import Count, IntegerField, OuterRef, Subquery, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
+
+from core.apps.membership.models import Membership
+from core.apps.users.models import TrainerMember
+from core.apps.workout.models import MemberProgress, WorkoutPlan, WorkoutSession
+
+CACHE_TIMEOUT = 60
+ADHERENCE_WEEKS = 4
+
+
+def _count(queryset):
+    """Correlated COUNT(*) of `queryset` for use as an annotation"""
+    return Coalesce(
+        Subquery(
+            queryset.order_by()
+            .values("member_id")
+            .annotate(count=Count("id"))
+            .values("count")[:1],
+            output_field=IntegerField(),
+        ),
+        Value(0),
+    )
+
+
+def _build(trainer_id):
+    today = timezone.localdate()
+    week_start = timezone.make_aware(
+        datetime.datetime.combine(
+            today - datetime.timedelta(days=today.weekday()), datetime.time.min
+        )
+    )
+    adherence_start = timezone.now() - datetime.timedelta(weeks=ADHERENCE_WEEKS)
+
+    member = OuterRef("member_id")
+    sessions = WorkoutSession.objects.filter(member_id=member)
+    last_session = sessions.order_by("-start_time", "-id")
+    rows = (
+        TrainerMember.objects.active_for(trainer_id)
+        .filter(member__is_deleted=False)
+        .annotate(
+            last_session_id=Subquery(last_session.values("id")[:1]),
+            last_session_start=Subquery(last_session.values("start_time")[:1]),
+            last_session_status=Subquery(last_session.values("status")[:1]),
+            sessions_this_week=_count(sessions.filter(start_time__gte=week_start)),
+            completed_recently=_count(
+                sessions.filter(status="completed", start_time__gte=adherence_start)
+            ),
+            # Each active plan is one scheduled workout per week.
+            scheduled_per_week=_count(
+                WorkoutPlan.objects.filter(member_id=member, is_active=True)
+            ),
+            latest_weight=Subquery(
+                MemberProgress.objects.filter(member_id=member)
+                .order_by("-recorded_date", "-id")
+                .values("weight")[:1]
+            ),
+            membership_end=Subquery(
+                Membership.objects.filter(member_id=member, is_active=True)
+                .order_by("-end_date")
+                .values("end_date")[:1]
+            ),
+        )
+        .order_by("member__username")
+        .values(
+            "member_id",
+            "member__username",
+            "assigned_date",
+            "last_session_id",
+            "last_session_start",
+            "last_session_status",
+            "sessions_this_week",
+            "completed_recently",
+            "scheduled_per_week",
+            "latest_weight",
+            "membership_end",
+        )
+    )
+
+    members = []
+    for row in rows:
+        scheduled = row["scheduled_per_week"] * ADHERENCE_WEEKS
+        members.append(
+            {
+                "member": row["member_id"],
+                "member_name": row["member__username"],
+                "assigned_date": row["assigned_date"],
+                "last_session": (
+                    {
+                        "id": row["last_session_id"],
+                        "start_time": row["last_session_start"],
+                        "status": row["last_session_status"],
+                    }
+                    if row["last_session_id"]
+                    else None
+                ),
+                "sessions_this_week": row["sessions_this_week"],
+                "latest_weight": row["latest_weight"],
+                "membership_end_date": row["membership_end"],
+                "adherence_rate": (
+                    round(min(row["completed_recently"] / scheduled, 1.0), 2)
+                    if scheduled
+                    else None
+                ),
+            }
+        )
+    return {
+        "generated_at": timezone.now(),
+        "week_start": week_start.date(),
+        "adherence_weeks": ADHERENCE_WEEKS,
+        "members": members,
+    }
+
+
+def trainer_dashboard(trainer_id):
+    """
+    Per-member overview for every active assignment of a trainer, computed in
+    a single annotated query and cached briefly per trainer.
+
+    Adherence is the share of scheduled workouts (one per active plan per
+    week) completed over the last ADHERENCE_WEEKS weeks.
+    """
+    key = f"trainer-dashboard:{trainer_id}"
+    data = cache.get(key)
+    if data is None:
+        data = _build(trainer_id)
+        cache.set(key, data, CACHE_TIMEOUT)
+    return data
@@ -0,0 +1,66 @@
+from django.core.management.base import BaseCommand, CommandError
+from django.utils.dateparse import parse_date
+
+from core.apps.workout.models import DailyTrainingSummary, WorkoutLog
+
+
+class Command(BaseCommand):
+    help = "Rebuild daily training summaries from workout logs, a chunk of members at a time"
+
+    def add_arguments(self, parser):
+        parser.add_argument(
+            "--chunk-size",
+            type=int,
+            default=200,
+            help="Number of members rebuilt per transaction",
+        )
+        parser.add_argument(
+            "--member",
+            type=int,
+            action="append",
+            dest="members",
+            help="Only rebuild this member id (may be repeated)",
+        )
+        parser.add_argument(
+            "--since",
+            help="Only rebuild days on or after this date (YYYY-MM-DD)",
+        )
+
+    def handle(self, *args, **options):
+        chunk_size = options["chunk_size"]
+        if chunk_size <= 0:
+            raise CommandError("--chunk-size must be greater than 0")
+
+        since = None
+        if options["since"]:
+            since = parse_date(options["since"])
+            if since is None:
+                raise CommandError("--since must be a date in YYYY-MM-DD format")
+
+        member_ids = options["members"]
+        if not member_ids:
+            # Members with summaries but no remaining logs are included so
+            # their stale rows get cleared.
+            logs = WorkoutLog.objects.all()
+            summaries = DailyTrainingSummary.objects.all()
+            if since is not None:
+                logs = logs.filter(date__gte=since)
+                summaries = summaries.filter(date__gte=since)
+            member_ids = list(
+                logs.values_list("member_id", flat=True).order_by().distinct()
+            ) + list(
+                summaries.values_list("member_id", flat=True).order_by().distinct()
+            )
+        member_ids = sorted(set(member_ids))
+
+        total = 0
+        for start in range(0, len(member_ids), chunk_size):
+            chunk = member_ids[start : start + chunk_size]
+            total += DailyTrainingSummary.objects.rebuild(chunk, since=since)
+            self.stdout.write(
+                f"Rebuilt members {chunk[0]}-{chunk[-1]} ({start + len(chunk)}/{len(member_ids)})"
+            )
+
+        self.stdout.write(
+            self.style.SUCCESS(f"Rebuilt {total} daily training summaries")
+        )
@@ -0,0 +1,25 @@
+# Generated by Django 5.2.6 on 2026-10-17 16:24
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0002_remove_workoutsession_completed_and_more"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="workoutlog",
+            index=models.Index(
+                fields=["member", "date", "id"], name="workout_logs_member_date_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutlog",
+            index=models.Index(fields=["date", "id"], name="workout_logs_date_idx"),
+        ),
+    ]
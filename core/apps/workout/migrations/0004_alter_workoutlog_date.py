@@ -0,0 +1,22 @@
+# Generated by Django 5.2.6 on 2026-10-17 16:25
+
+import django.utils.timezone
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0003_workoutlog_keyset_indexes"),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name="workoutlog",
+            name="date",
+            field=models.DateField(
+                default=django.utils.timezone.localdate,
+                help_text="Date when the workout was performed",
+            ),
+        ),
+    ]
@@ -0,0 +1,95 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:22
+
+import django.db.models.deletion
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0004_alter_workoutlog_date"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="DailyTrainingSummary",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "date",
+                    models.DateField(
+                        help_text="Day the summarised workouts were performed"
+                    ),
+                ),
+                (
+                    "log_count",
+                    models.IntegerField(
+                        default=0, help_text="Number of workout log entries on this day"
+                    ),
+                ),
+                (
+                    "exercise_count",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Number of distinct exercises performed on this day",
+                    ),
+                ),
+                (
+                    "total_sets",
+                    models.IntegerField(
+                        default=0, help_text="Total sets completed on this day"
+                    ),
+                ),
+                (
+                    "total_reps",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total repetitions (sets x reps) completed on this day",
+                    ),
+                ),
+                (
+                    "total_volume",
+                    models.FloatField(
+                        default=0,
+                        help_text="Training volume (sets x reps x weight used) on this day",
+                    ),
+                ),
+                (
+                    "total_minutes",
+                    models.IntegerField(
+                        default=0,
+                        help_text="Total logged exercise duration in minutes on this day",
+                    ),
+                ),
+                (
+                    "member",
+                    models.ForeignKey(
+                        help_text="Member whose training is summarised",
+                        limit_choices_to={"role": "member"},
+                        on_delete=django.db.models.deletion.CASCADE,
+                        related_name="daily_training_summaries",
+                        to=settings.AUTH_USER_MODEL,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "daily_training_summaries",
+                "constraints": [
+                    models.UniqueConstraint(
+                        fields=("member", "date"),
+                        name="daily_training_member_date_uniq",
+                    )
+                ],
+            },
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:27
+
+from django.conf import settings
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0005_daily_training_summaries"),
+        migrations.swappable_dependency(settings.AUTH_USER_MODEL),
+    ]
+
+    operations = [
+        migrations.AddIndex(
+            model_name="exercise",
+            index=models.Index(
+                fields=["is_active", "category"], name="exercises_category_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exercise",
+            index=models.Index(fields=["is_active", "name"], name="exercises_name_idx"),
+        ),
+        migrations.AddIndex(
+            model_name="memberprogress",
+            index=models.Index(
+                fields=["member", "recorded_date", "id"],
+                name="member_progress_member_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutplan",
+            index=models.Index(
+                fields=["member", "is_active", "day_of_week"],
+                name="workout_plans_member_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutplan",
+            index=models.Index(
+                fields=["trainer", "is_active"], name="workout_plans_trainer_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutplan",
+            index=models.Index(
+                fields=["is_active", "goal"], name="workout_plans_goal_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutplanexercise",
+            index=models.Index(
+                fields=["workout_plan", "order", "id"],
+                name="workout_plan_exercises_ord_idx",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutsession",
+            index=models.Index(
+                fields=["member", "start_time"], name="workout_sessions_member_idx"
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="workoutsession",
+            index=models.Index(
+                fields=["status", "start_time"], name="workout_sessions_status_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,70 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:30
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0006_list_filter_indexes"),
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name="MuscleGroup",
+            fields=[
+                (
+                    "id",
+                    models.BigAutoField(
+                        auto_created=True,
+                        primary_key=True,
+                        serialize=False,
+                        verbose_name="ID",
+                    ),
+                ),
+                (
+                    "name",
+                    models.CharField(
+                        help_text="Normalized (lowercase) muscle group name",
+                        max_length=50,
+                        unique=True,
+                    ),
+                ),
+                (
+                    "bit",
+                    models.PositiveSmallIntegerField(
+                        help_text="Bit position of this muscle group in exercise masks",
+                        unique=True,
+                    ),
+                ),
+            ],
+            options={
+                "db_table": "muscle_groups",
+            },
+        ),
+        migrations.AddField(
+            model_name="exercise",
+            name="muscle_mask",
+            field=models.BigIntegerField(
+                default=0,
+                help_text="Bitmask of the targeted muscle groups (see MuscleGroup.bit)",
+            ),
+        ),
+        migrations.AddField(
+            model_name="exercise",
+            name="targeted_muscles",
+            field=models.ManyToManyField(
+                blank=True,
+                db_table="exercise_muscle_groups",
+                help_text="Normalized muscle groups, kept in sync with muscle_groups",
+                related_name="exercises",
+                to="workout.musclegroup",
+            ),
+        ),
+        migrations.AddIndex(
+            model_name="exercise",
+            index=models.Index(
+                fields=["is_active", "muscle_mask"], name="exercises_muscle_idx"
+            ),
+        ),
+    ]
@@ -0,0 +1,68 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:30
+
+from django.db import migrations
+
+
+def parse_muscle_groups(value):
+    names = []
+    for part in (value or "").split(","):
+        name = " ".join(part.lower().split())
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+def populate_muscle_groups(apps, schema_editor):
+    Exercise = apps.get_model("workout", "Exercise")
+    MuscleGroup = apps.get_model("workout", "MuscleGroup")
+    ExerciseMuscleGroup = Exercise.targeted_muscles.through
+
+    exercises = list(Exercise.objects.only("id", "muscle_groups"))
+    parsed = {
+        exercise.id: parse_muscle_groups(exercise.muscle_groups)
+        for exercise in exercises
+    }
+
+    names = []
+    for exercise_names in parsed.values():
+        names.extend(name for name in exercise_names if name not in names)
+    if len(names) > 63:
+        raise RuntimeError(
+            f"Found {len(names)} distinct muscle groups; at most 63 fit in a mask"
+        )
+    MuscleGroup.objects.bulk_create(
+        [MuscleGroup(name=name, bit=bit) for bit, name in enumerate(names)]
+    )
+    groups = {group.name: group for group in MuscleGroup.objects.all()}
+
+    links = []
+    for exercise in exercises:
+        exercise.muscle_mask = 0
+        for name in parsed[exercise.id]:
+            exercise.muscle_mask |= 1 << groups[name].bit
+            links.append(
+                ExerciseMuscleGroup(
+                    exercise_id=exercise.id, musclegroup_id=groups[name].id
+                )
+            )
+    Exercise.objects.bulk_update(exercises, ["muscle_mask"], batch_size=500)
+    ExerciseMuscleGroup.objects.bulk_create(links, batch_size=1000)
+
+
+def clear_muscle_groups(apps, schema_editor):
+    Exercise = apps.get_model("workout", "Exercise")
+    MuscleGroup = apps.get_model("workout", "MuscleGroup")
+    Exercise.targeted_muscles.through.objects.all().delete()
+    Exercise.objects.update(muscle_mask=0)
+    MuscleGroup.objects.all().delete()
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0007_muscle_groups"),
+    ]
+
+    operations = [
+        migrations.RunPython(populate_muscle_groups, clear_muscle_groups),
+    ]
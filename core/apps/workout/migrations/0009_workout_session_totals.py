@@ -0,0 +1,31 @@
+# Generated by Django 5.2.6 on 2026-10-17 17:38
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0008_populate_muscle_groups"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workoutsession",
+            name="active_minutes",
+            field=models.IntegerField(
+                blank=True,
+                help_text="Exercise minutes logged during the session, set on completion",
+                null=True,
+            ),
+        ),
+        migrations.AddField(
+            model_name="workoutsession",
+            name="total_volume",
+            field=models.FloatField(
+                blank=True,
+                help_text="Training volume (sets x reps x weight used) logged during the session, set on completion",
+                null=True,
+            ),
+        ),
+    ]
@@ -0,0 +1,35 @@
+# Generated by Django 5.2.6 on 2026-10-17 18:03
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0009_workout_session_totals"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="exercise",
+            name="exercise_image_derivatives",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Upload whose thumb/medium/full derivatives have been generated",
+                max_length=100,
+            ),
+        ),
+        migrations.AddField(
+            model_name="memberprogress",
+            name="progress_photos_derivatives",
+            field=models.CharField(
+                blank=True,
+                default="",
+                editable=False,
+                help_text="Upload whose thumb/medium/full derivatives have been generated",
+                max_length=100,
+            ),
+        ),
+    ]
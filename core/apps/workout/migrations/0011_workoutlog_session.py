@@ -0,0 +1,26 @@
+# Generated by Django 5.2.6 on 2026-10-17 18:04
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ("workout", "0010_image_derivatives_state"),
+    ]
+
+    operations = [
+        migrations.AddField(
+            model_name="workoutlog",
+            name="session",
+            field=models.ForeignKey(
+                blank=True,
+                help_text="Workout session this log entry was recorded in (optional)",
+                null=True,
+                on_delete=django.db.models.deletion.SET_NULL,
+                related_name="logs",
+                to="workout.workoutsession",
+            ),
+        ),
+    ]
@@ -1,7 +1,23 @@
-from django.db import models
+from django.db import connection, models, transaction
+from django.db.models import F, Q, Count, Sum, Value
+from django.db.models.functions import Coalesce
+from django.utils import timezone
 from core.apps.users.models import User
 
 
+class WorkoutPlanQuerySet(models.QuerySet):
+    def with_details(self):
+        """Load everything WorkoutPlanSerializer reads in a fixed number of queries."""
+        return self.select_related("trainer", "member").prefetch_related(
+            models.Prefetch(
+                "plan_exercises",
+                queryset=WorkoutPlanExercise.objects.select_related(
+                    "exercise"
+                ).order_by("order", "id"),
+            )
+        )
+
+
 class WorkoutPlan(models.Model):
     GOAL_CHOICES = [
         ("fat_loss", "Fat Loss"),
@@ -23,6 +39,16 @@ class WorkoutPlan(models.Model):
 
     class Meta:
         db_table = "workout_plans"
+        indexes = [
+            models.Index(
+                fields=["member", "is_active", "day_of_week"],
+                name="workout_plans_member_idx",
+            ),
+            models.Index(
+                fields=["trainer", "is_active"], name="workout_plans_trainer_idx"
+            ),
+            models.Index(fields=["is_active", "goal"], name="workout_plans_goal_idx"),
+        ]
 
     trainer = models.ForeignKey(
         User,
@@ -66,9 +92,198 @@ class WorkoutPlan(models.Model):
         auto_now=True, help_text="Date and time when the workout plan was last updated"
     )
 
+    objects = WorkoutPlanQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} - {self.member.username} ({self.day_of_week})"
 
+    COPIED_FIELDS = [
+        "name",
+        "description",
+        "goal",
+        "day_of_week",
+        "duration_weeks",
+        "calories_target",
+    ]
+    COPIED_EXERCISE_FIELDS = [
+        "exercise_id",
+        "sets",
+        "reps",
+        "weight",
+        "rest_time_seconds",
+        "order",
+        "notes",
+    ]
+
+    def replace_exercises(self, items):
+        """
+        Make the plan's exercises exactly `items`, in order. Items carrying an
+        `id` update that row and the others are inserted; rows left out are
+        deleted. Raises ValueError for ids that are not on this plan.
+        """
+        with transaction.atomic():
+            current = {
+                row.pk: row
+                for row in WorkoutPlanExercise.objects.select_for_update().filter(
+                    workout_plan=self
+                )
+            }
+            kept_ids = [item["id"] for item in items if "id" in item]
+            unknown = sorted(set(kept_ids) - set(current))
+            if unknown:
+                raise ValueError(
+                    f"Plan exercises {unknown} do not belong to this plan."
+                )
+            if len(kept_ids) != len(set(kept_ids)):
+                raise ValueError("Each existing exercise can only be listed once.")
+
+            removed = set(current) - set(kept_ids)
+            if removed:
+                WorkoutPlanExercise.objects.filter(id__in=removed).delete()
+
+            changed, moved, created = [], [], []
+            for position, item in enumerate(items, start=1):
+                values = {
+                    "weight": None,
+                    "rest_time_seconds": 60,
+                    "notes": None,
+                    **{field: value for field, value in item.items() if field != "id"},
+                    "order": position,
+                }
+                if "id" not in item:
+                    created.append(WorkoutPlanExercise(workout_plan=self, **values))
+                    continue
+                row = current[item["id"]]
+                if all(getattr(row, field) == value for field, value in values.items()):
+                    continue
+                if row.order != position:
+                    moved.append(row)
+                for field, value in values.items():
+                    setattr(row, field, value)
+                changed.append(row)
+
+            # (workout_plan, exercise, order) is unique, so rows that move are
+            # parked on negative orders before taking their final positions.
+            if moved:
+                final_orders = [row.order for row in moved]
+                for row in moved:
+                    row.order = -row.order
+                WorkoutPlanExercise.objects.bulk_update(moved, ["order"])
+                for row, order in zip(moved, final_orders):
+                    row.order = order
+            if changed:
+                WorkoutPlanExercise.objects.bulk_update(
+                    changed, self.COPIED_EXERCISE_FIELDS
+                )
+            if created:
+                WorkoutPlanExercise.objects.bulk_create(created)
+
+    def clone_to(self, member_ids, trainer=None):
+        """
+        Copy this plan and its exercises to each of `member_ids`, returning the
+        new plans in member order. Exercises always go in with one bulk insert;
+        plans do too where the backend returns the new ids.
+        """
+        trainer = trainer or self.trainer
+        plans = [
+            WorkoutPlan(
+                trainer=trainer,
+                member_id=member_id,
+                **{field: getattr(self, field) for field in self.COPIED_FIELDS},
+            )
+            for member_id in member_ids
+        ]
+        exercises = list(
+            self.plan_exercises.order_by("order", "id").values(
+                *self.COPIED_EXERCISE_FIELDS
+            )
+        )
+        with transaction.atomic():
+            if connection.features.can_return_rows_from_bulk_insert:
+                plans = WorkoutPlan.objects.bulk_create(plans)
+            else:
+                # MySQL cannot return ids from a bulk insert, so each plan is
+                # saved on its own to learn its pk.
+                for plan in plans:
+                    plan.save()
+            WorkoutPlanExercise.objects.bulk_create(
+                [
+                    WorkoutPlanExercise(workout_plan=plan, **exercise)
+                    for plan in plans
+                    for exercise in exercises
+                ]
+            )
+        return plans
+
+
+def parse_muscle_groups(value):
+    """Split a comma-separated muscle list into normalized, de-duplicated names"""
+    names = []
+    for part in (value or "").split(","):
+        name = " ".join(part.lower().split())
+        if name and name not in names:
+            names.append(name)
+    return names
+
+
+class MuscleGroupQuerySet(models.QuerySet):
+    def mask_for(self, names):
+        """Bitmask of the named muscle groups; unknown names are ignored"""
+        mask = 0
+        for bit in self.filter(name__in=names).values_list("bit", flat=True):
+            mask |= 1 << bit
+        return mask
+
+    def resolve(self, names):
+        """Return the muscle groups for `names`, creating missing ones on free bits"""
+        groups = {group.name: group for group in self.filter(name__in=names)}
+        missing = [name for name in names if name not in groups]
+        if missing:
+            used = set(self.values_list("bit", flat=True))
+            free = [bit for bit in range(MuscleGroup.MAX_GROUPS) if bit not in used]
+            if len(free) < len(missing):
+                raise ValueError(
+                    f"Cannot track more than {MuscleGroup.MAX_GROUPS} muscle groups"
+                )
+            for name, bit in zip(missing, free):
+                groups[name] = self.create(name=name, bit=bit)
+        return [groups[name] for name in names]
+
+
+class MuscleGroup(models.Model):
+    """A muscle group an exercise can target, with its bit in Exercise.muscle_mask"""
+
+    # Bits of a signed 64-bit column
+    MAX_GROUPS = 63
+
+    class Meta:
+        db_table = "muscle_groups"
+
+    name = models.CharField(
+        max_length=50, unique=True, help_text="Normalized (lowercase) muscle group name"
+    )
+    bit = models.PositiveSmallIntegerField(
+        unique=True, help_text="Bit position of this muscle group in exercise masks"
+    )
+
+    objects = MuscleGroupQuerySet.as_manager()
+
+    def __str__(self):
+        return self.name
+
+    @property
+    def mask(self):
+        return 1 << self.bit
+
+
+class ExerciseQuerySet(models.QuerySet):
+    def targeting(self, mask, match_all=False):
+        """Exercises hitting any (or, with match_all, all) muscles in `mask`"""
+        annotated = self.annotate(muscle_hits=F("muscle_mask").bitand(mask))
+        if match_all:
+            return annotated.filter(muscle_hits=mask)
+        return annotated.exclude(muscle_hits=0)
+
 
 class Exercise(models.Model):
     CATEGORY_CHOICES = [
@@ -85,6 +300,16 @@ class Exercise(models.Model):
 
     class Meta:
         db_table = "exercises"
+        indexes = [
+            # Lets muscle filters scan the index instead of the table.
+            models.Index(
+                fields=["is_active", "muscle_mask"], name="exercises_muscle_idx"
+            ),
+            models.Index(
+                fields=["is_active", "category"], name="exercises_category_idx"
+            ),
+            models.Index(fields=["is_active", "name"], name="exercises_name_idx"),
+        ]
 
     name = models.CharField(max_length=100, help_text="Name of the exercise")
     category = models.CharField(
@@ -104,6 +329,17 @@ class Exercise(models.Model):
         max_length=200,
         help_text="Comma-separated list of muscle groups targeted (e.g., 'chest, triceps, shoulders')",
     )
+    targeted_muscles = models.ManyToManyField(
+        MuscleGroup,
+        related_name="exercises",
+        db_table="exercise_muscle_groups",
+        blank=True,
+        help_text="Normalized muscle groups, kept in sync with muscle_groups",
+    )
+    muscle_mask = models.BigIntegerField(
+        default=0,
+        help_text="Bitmask of the targeted muscle groups (see MuscleGroup.bit)",
+    )
     equipment_needed = models.CharField(
         max_length=200,
         blank=True,
@@ -131,6 +367,13 @@ class Exercise(models.Model):
         null=True,
         help_text="Image demonstrating the exercise",
     )
+    exercise_image_derivatives = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Upload whose thumb/medium/full derivatives have been generated",
+    )
     video_url = models.URLField(
         blank=True, null=True, help_text="URL to a video demonstration of the exercise"
     )
@@ -141,14 +384,40 @@ class Exercise(models.Model):
         auto_now_add=True, help_text="Date and time when the exercise was created"
     )
 
+    objects = ExerciseQuerySet.as_manager()
+
     def __str__(self):
         return f"{self.name} ({self.category})"
 
+    def save(self, *args, **kwargs):
+        update_fields = kwargs.get("update_fields")
+        if update_fields is not None and "muscle_groups" not in update_fields:
+            return super().save(*args, **kwargs)
+
+        # Derive the normalized muscle groups and mask from muscle_groups.
+        with transaction.atomic():
+            groups = MuscleGroup.objects.resolve(
+                parse_muscle_groups(self.muscle_groups)
+            )
+            self.muscle_mask = 0
+            for group in groups:
+                self.muscle_mask |= group.mask
+            if update_fields is not None:
+                kwargs["update_fields"] = {*update_fields, "muscle_mask"}
+            super().save(*args, **kwargs)
+            self.targeted_muscles.set(groups)
+
 
 class WorkoutPlanExercise(models.Model):
     class Meta:
         db_table = "workout_plan_exercises"
         unique_together = ("workout_plan", "exercise", "order")
+        indexes = [
+            models.Index(
+                fields=["workout_plan", "order", "id"],
+                name="workout_plan_exercises_ord_idx",
+            ),
+        ]
 
     workout_plan = models.ForeignKey(
         WorkoutPlan,
@@ -184,6 +453,14 @@ class WorkoutPlanExercise(models.Model):
 class WorkoutLog(models.Model):
     class Meta:
         db_table = "workout_logs"
+        indexes = [
+            # Back keyset pagination on (date, id): per member for members and
+            # trainers, and across the whole table for admins.
+            models.Index(
+                fields=["member", "date", "id"], name="workout_logs_member_date_idx"
+            ),
+            models.Index(fields=["date", "id"], name="workout_logs_date_idx"),
+        ]
 
     member = models.ForeignKey(
         User,
@@ -200,11 +477,19 @@ class WorkoutLog(models.Model):
         null=True,
         help_text="Workout plan this log entry belongs to (optional)",
     )
+    session = models.ForeignKey(
+        "WorkoutSession",
+        on_delete=models.SET_NULL,
+        related_name="logs",
+        blank=True,
+        null=True,
+        help_text="Workout session this log entry was recorded in (optional)",
+    )
     exercise = models.ForeignKey(
         Exercise, on_delete=models.CASCADE, help_text="Exercise that was performed"
     )
     date = models.DateField(
-        auto_now_add=True, help_text="Date when the workout was performed"
+        default=timezone.localdate, help_text="Date when the workout was performed"
     )
     sets_completed = models.IntegerField(help_text="Number of sets actually completed")
     reps_completed = models.IntegerField(
@@ -225,12 +510,169 @@ class WorkoutLog(models.Model):
     def __str__(self):
         return f"{self.member.username} - {self.exercise.name} on {self.date}"
 
+    def save(self, *args, **kwargs):
+        # Keep the insert/update and the daily summary refresh (see signals.py)
+        # in one transaction.
+        with transaction.atomic():
+            super().save(*args, **kwargs)
+
+
+class DailyTrainingSummaryQuerySet(models.QuerySet):
+    def _aggregate_logs(self, logs):
+        return (
+            logs.values("member_id", "date")
+            .order_by()
+            .annotate(
+                log_count=Count("id"),
+                exercise_count=Count("exercise_id", distinct=True),
+                total_sets=Sum("sets_completed"),
+                total_reps=Sum(F("sets_completed") * F("reps_completed")),
+                total_volume=Sum(
+                    F("sets_completed")
+                    * F("reps_completed")
+                    * Coalesce("weight_used", Value(0.0)),
+                    output_field=models.FloatField(),
+                ),
+                total_minutes=Coalesce(Sum("duration_minutes"), Value(0)),
+            )
+        )
+
+    def _upsert(self, rows):
+        # MySQL's ON DUPLICATE KEY UPDATE takes no conflict target and
+        # rejects unique_fields; the other backends require it.
+        conflict_target = {}
+        if connection.features.supports_update_conflicts_with_target:
+            conflict_target["unique_fields"] = ["member", "date"]
+        return self.bulk_create(
+            [self.model(**row) for row in rows],
+            update_conflicts=True,
+            update_fields=DailyTrainingSummary.TOTAL_FIELDS,
+            **conflict_target,
+        )
+
+    def _lock(self, keys, key_filter):
+        """
+        Lock the summary rows of `keys` for the rest of the transaction,
+        creating empty ones first so that days without a summary yet can be
+        locked too.
+
+        Refreshes of the same member and day then run one after the other, and
+        each aggregates the logs committed by the previous one.
+        """
+        self.bulk_create(
+            [self.model(member_id=member_id, date=date) for member_id, date in keys],
+            ignore_conflicts=True,
+        )
+        list(
+            self.select_for_update()
+            .filter(key_filter)
+            .order_by("member_id", "date")
+            .values_list("pk", flat=True)
+        )
+
+    def refresh(self, keys):
+        """
+        Recompute the summaries for the given (member_id, date) pairs from
+        workout_logs, removing rows whose day no longer has any logs.
+        """
+        keys = {key for key in keys if None not in key}
+        if not keys:
+            return
+        key_filter = Q()
+        for member_id, date in keys:
+            key_filter |= Q(member_id=member_id, date=date)
+
+        with transaction.atomic():
+            self._lock(keys, key_filter)
+            rows = list(self._aggregate_logs(WorkoutLog.objects.filter(key_filter)))
+            self._upsert(rows)
+            empty = keys - {(row["member_id"], row["date"]) for row in rows}
+            if empty:
+                empty_filter = Q()
+                for member_id, date in empty:
+                    empty_filter |= Q(member_id=member_id, date=date)
+                self.filter(empty_filter).delete()
+
+    def rebuild(self, member_ids, since=None):
+        """Replace the summaries of the given members from workout_logs"""
+        logs = WorkoutLog.objects.filter(member_id__in=member_ids)
+        summaries = self.filter(member_id__in=member_ids)
+        if since is not None:
+            logs = logs.filter(date__gte=since)
+            summaries = summaries.filter(date__gte=since)
+
+        with transaction.atomic():
+            summaries.delete()
+            rows = list(self._aggregate_logs(logs))
+            self._upsert(rows)
+        return len(rows)
+
+
+class DailyTrainingSummary(models.Model):
+    """Per-member, per-day rollup of workout_logs, kept in sync on every write"""
+
+    TOTAL_FIELDS = [
+        "log_count",
+        "exercise_count",
+        "total_sets",
+        "total_reps",
+        "total_volume",
+        "total_minutes",
+    ]
+
+    class Meta:
+        db_table = "daily_training_summaries"
+        constraints = [
+            models.UniqueConstraint(
+                fields=["member", "date"], name="daily_training_member_date_uniq"
+            ),
+        ]
+
+    member = models.ForeignKey(
+        User,
+        on_delete=models.CASCADE,
+        related_name="daily_training_summaries",
+        limit_choices_to={"role": "member"},
+        help_text="Member whose training is summarised",
+    )
+    date = models.DateField(help_text="Day the summarised workouts were performed")
+    log_count = models.IntegerField(
+        default=0, help_text="Number of workout log entries on this day"
+    )
+    exercise_count = models.IntegerField(
+        default=0, help_text="Number of distinct exercises performed on this day"
+    )
+    total_sets = models.IntegerField(
+        default=0, help_text="Total sets completed on this day"
+    )
+    total_reps = models.IntegerField(
+        default=0, help_text="Total repetitions (sets x reps) completed on this day"
+    )
+    total_volume = models.FloatField(
+        default=0,
+        help_text="Training volume (sets x reps x weight used) on this day",
+    )
+    total_minutes = models.IntegerField(
+        default=0, help_text="Total logged exercise duration in minutes on this day"
+    )
+
+    objects = DailyTrainingSummaryQuerySet.as_manager()
+
+    def __str__(self):
+        return f"{self.member.username} - {self.total_volume} volume on {self.date}"
+
 
 class MemberProgress(models.Model):
     """Track member's physical progress over time"""
 
     class Meta:
         db_table = "member_progress"
+        indexes = [
+            models.Index(
+                fields=["member", "recorded_date", "id"],
+                name="member_progress_member_idx",
+            ),
+        ]
 
     member = models.ForeignKey(
         User,
@@ -257,6 +699,13 @@ class MemberProgress(models.Model):
         null=True,
         help_text="Progress photos to track visual changes",
     )
+    progress_photos_derivatives = models.CharField(
+        max_length=100,
+        blank=True,
+        default="",
+        editable=False,
+        help_text="Upload whose thumb/medium/full derivatives have been generated",
+    )
     notes = models.TextField(
         blank=True, null=True, help_text="Additional notes about the progress record"
     )
@@ -275,9 +724,19 @@ class WorkoutSession(models.Model):
         ("pending", "Pending"),
         ("completed", "Completed"),
     ]
+    # calories_per_minute on exercises is quoted for a member of this weight.
+    REFERENCE_WEIGHT_KG = 70.0
 
     class Meta:
         db_table = "workout_sessions"
+        indexes = [
+            models.Index(
+                fields=["member", "start_time"], name="workout_sessions_member_idx"
+            ),
+            models.Index(
+                fields=["status", "start_time"], name="workout_sessions_status_idx"
+            ),
+        ]
 
     member = models.ForeignKey(
         User,
@@ -301,6 +760,16 @@ class WorkoutSession(models.Model):
     total_calories_burned = models.IntegerField(
         blank=True, null=True, help_text="Total calories burned during the session"
     )
+    active_minutes = models.IntegerField(
+        blank=True,
+        null=True,
+        help_text="Exercise minutes logged during the session, set on completion",
+    )
+    total_volume = models.FloatField(
+        blank=True,
+        null=True,
+        help_text="Training volume (sets x reps x weight used) logged during the session, set on completion",
+    )
 
     status = models.CharField(
         max_length=20,
@@ -327,3 +796,63 @@ class WorkoutSession(models.Model):
         if self.end_time:
             return int((self.end_time - self.start_time).total_seconds() / 60)
         return None
+
+    def get_logs(self):
+        """Workout logs recorded against this session"""
+        return self.logs.all()
+
+    def log_error(self, member_id, workout_plan_id=None):
+        """Why a log of this member and plan cannot join the session, if it cannot"""
+        if self.status == "completed":
+            return "This workout session is already completed."
+        if member_id != self.member_id:
+            return "Workout session not found for this member."
+        if workout_plan_id is not None and workout_plan_id != self.workout_plan_id:
+            return "Workout session belongs to a different workout plan."
+        return None
+
+    def compute_totals(self):
+        """
+        Calories, active minutes and volume of the session's logs in one
+        aggregate query. Calories scale each exercise's calories_per_minute by
+        the member's weight; members without a weight count as the reference.
+        """
+        weight_factor = Coalesce(
+            F("member__weight"), Value(self.REFERENCE_WEIGHT_KG)
+        ) / Value(self.REFERENCE_WEIGHT_KG)
+        totals = self.get_logs().aggregate(
+            calories=Sum(
+                Coalesce("duration_minutes", Value(0))
+                * Coalesce("exercise__calories_per_minute", Value(0.0))
+                * weight_factor,
+                output_field=models.FloatField(),
+            ),
+            minutes=Sum("duration_minutes"),
+            volume=Sum(
+                F("sets_completed")
+                * F("reps_completed")
+                * Coalesce("weight_used", Value(0.0)),
+                output_field=models.FloatField(),
+            ),
+        )
+        return {
+            "total_calories_burned": round(totals["calories"] or 0),
+            "active_minutes": totals["minutes"] or 0,
+            "total_volume": round(totals["volume"] or 0.0, 2),
+        }
+
+    def complete(self, end_time=None):
+        """Mark the session completed and store its totals from the logs"""
+        self.end_time = end_time or self.end_time or timezone.now()
+        self.status = "completed"
+        for field, value in self.compute_totals().items():
+            setattr(self, field, value)
+        self.save(
+            update_fields=[
+                "end_time",
+                "status",
+                "total_calories_burned",
+                "active_minutes",
+                "total_volume",
+            ]
+        )
@@ -0,0 +1,140 @@
+from django.core.cache import cache
+from django.db.models import Case, F, IntegerField, Value, When
+from django.db.models.functions import Abs
+
+from core.apps.diet.models import NutritionPlan
+from core.apps.diet.serializers.serializers import NutritionPlanSerializer
+from core.apps.users.caching.caching import get_version
+from core.apps.workout.models import Exercise, WorkoutPlan
+from core.apps.workout.serializers.serializers import (
+    ExerciseSerializer,
+    WorkoutPlanSerializer,
+)
+
+NAMESPACE = "recommendations"
+BUCKET_SIZE = 10
+BUCKET_TIMEOUT = 60 * 60
+
+# Per BMI category: plan goals and exercise categories in order of preference,
+# and the calorie band nutrition plans are ranked against.
+PROFILES = {
+    "Underweight": {
+        "goals": ["muscle_gain", "strength", "general_fitness"],
+        "exercise_categories": ["full_body", "legs", "chest", "back", "shoulders"],
+        "calories": (2500, 3500),
+    },
+    "Normal weight": {
+        "goals": ["general_fitness", "strength", "endurance"],
+        "exercise_categories": ["full_body", "cardio", "legs", "back"],
+        "calories": (2000, 2500),
+    },
+    "Overweight": {
+        "goals": ["fat_loss", "weight_loss", "general_fitness", "endurance"],
+        "exercise_categories": ["cardio", "full_body", "legs"],
+        "calories": (1600, 2000),
+    },
+    "Obese": {
+        "goals": ["weight_loss", "fat_loss", "general_fitness"],
+        "exercise_categories": ["cardio", "full_body"],
+        "calories": (1400, 1800),
+    },
+}
+
+
+def bmi_category(bmi):
+    if bmi < 18.5:
+        return "Underweight"
+    if bmi < 25:
+        return "Normal weight"
+    if bmi < 30:
+        return "Overweight"
+    return "Obese"
+
+
+def _preference(field, values):
+    """Rank expression: 0 for the most preferred value, 1 for the next, ..."""
+    return Case(
+        *[
+            When(**{field: value}, then=Value(rank))
+            for rank, value in enumerate(values)
+        ],
+        default=Value(len(values)),
+        output_field=IntegerField(),
+    )
+
+
+def _scope(user):
+    """Cache scope and queryset filter for the plans `user` may see"""
+    if getattr(user, "is_super", False) or user.role == "admin":
+        return "all", {}
+    if user.role == "trainer":
+        return f"trainer:{user.pk}", {"trainer_id": user.pk}
+    return f"member:{user.pk}", {"member_id": user.pk}
+
+
+def _build_exercises(profile):
+    categories = profile["exercise_categories"]
+    exercises = (
+        Exercise.objects.filter(is_active=True, category__in=categories)
+        .annotate(rank=_preference("category", categories))
+        .order_by("rank", F("calories_per_minute").desc(nulls_last=True), "id")
+    )[:BUCKET_SIZE]
+    return list(ExerciseSerializer(exercises, many=True).data)
+
+
+def _build_plans(profile, plan_filter):
+    goals = profile["goals"]
+    plans = (
+        WorkoutPlan.objects.with_details()
+        .filter(is_active=True, goal__in=goals, **plan_filter)
+        .annotate(rank=_preference("goal", goals))
+        .order_by("rank", "-updated_date", "-id")
+    )[:BUCKET_SIZE]
+    low, high = profile["calories"]
+    nutrition_plans = (
+        NutritionPlan.objects.select_related("trainer", "member")
+        .filter(is_active=True, calories__range=(low, high), **plan_filter)
+        .annotate(distance=Abs(F("calories") - (low + high) // 2))
+        .order_by("distance", "-id")
+    )[:BUCKET_SIZE]
+    return {
+        "workout_plans": list(WorkoutPlanSerializer(plans, many=True).data),
+        "nutrition_plans": list(
+            NutritionPlanSerializer(nutrition_plans, many=True).data
+        ),
+    }
+
+
+def _cached(key, build):
+    data = cache.get(key)
+    if data is None:
+        data = build()
+        cache.set(key, data, BUCKET_TIMEOUT)
+    return data
+
+
+def recommend(category, user):
+    """
+    Ranked, size-limited recommendations for a BMI category as seen by
+    `user`. Buckets are cached per category (and, for plans, per visibility
+    scope) under the recommendations version, which writes to plans,
+    exercises and nutrition plans bump.
+    """
+    profile = PROFILES[category]
+    version = get_version(NAMESPACE)
+    scope, plan_filter = _scope(user)
+    slug = category.lower().replace(" ", "_")
+
+    exercises = _cached(
+        f"{NAMESPACE}:{version}:{slug}:exercises",
+        lambda: _build_exercises(profile),
+    )
+    plans = _cached(
+        f"{NAMESPACE}:{version}:{slug}:plans:{scope}",
+        lambda: _build_plans(profile, plan_filter),
+    )
+    return {
+        "workout_plans": plans["workout_plans"],
+        "exercises": exercises,
+        "nutrition_plans": plans["nutrition_plans"],
+    }
@@ -0,0 +1,227 @@
+import bisect
+import re
+import threading
+import time
+from collections import defaultdict
+
+TOKEN_RE = re.compile(r"[a-z0-9]+")
+
+
+def tokenize(text):
+    return TOKEN_RE.findall(text.lower()) if text else []
+
+
+def trigrams(token):
+    padded = f"  {token} "
+    return {padded[i : i + 3] for i in range(len(padded) - 2)}
+
+
+class ExerciseSearchIndex:
+    """
+    In-process inverted index over the active exercise catalog.
+
+    Tokens from name, muscle_groups, equipment_needed and description are
+    posted with a per-field weight. Lookups try, in order, an exact token, a
+    prefix of a known token (binary search over the sorted vocabulary) and
+    finally trigram similarity to absorb typos. Every query term must match
+    for a document to be returned.
+
+    The index is built lazily on first use and then patched one exercise at a
+    time from the Exercise save/delete signals. Saves made by other worker
+    processes are picked up by a full rebuild once the index is older than
+    `max_age` seconds.
+    """
+
+    field_weights = {
+        "name": 4.0,
+        "muscle_groups": 2.5,
+        "equipment_needed": 1.5,
+        "description": 1.0,
+    }
+    result_fields = ["id", "name", "category", "muscle_groups", "difficulty_level"]
+    prefix_factor = 0.8
+    fuzzy_factor = 0.5
+    min_similarity = 0.3
+    max_fuzzy_candidates = 5
+    max_prefix_expansions = 50
+
+    def __init__(self, max_age=300):
+        self.max_age = max_age
+        self._lock = threading.RLock()
+        self._built_at = None
+        self._reset()
+
+    def _reset(self):
+        self._documents = {}
+        self._doc_tokens = {}
+        self._postings = defaultdict(dict)
+        self._vocabulary = []
+        self._trigrams = defaultdict(set)
+
+    # Building
+
+    def _load_rows(self, **filters):
+        from core.apps.workout.models import Exercise
+
+        fields = set(self.result_fields) | set(self.field_weights)
+        return Exercise.objects.filter(is_active=True, **filters).values(*fields)
+
+    def rebuild(self):
+        with self._lock:
+            self._reset()
+            for row in self._load_rows():
+                self._add(row)
+            self._built_at = time.monotonic()
+
+    def ensure_built(self):
+        with self._lock:
+            if (
+                self._built_at is None
+                or time.monotonic() - self._built_at > self.max_age
+            ):
+                self.rebuild()
+
+    def _document_tokens(self, row):
+        weights = defaultdict(float)
+        for field, weight in self.field_weights.items():
+            value = row.get(field)
+            if field == "muscle_groups" and value:
+                value = " ".join(value.split(","))
+            for token in tokenize(value):
+                weights[token] = max(weights[token], weight)
+        return weights
+
+    def _add(self, row):
+        doc_id = row["id"]
+        tokens = self._document_tokens(row)
+        self._documents[doc_id] = {field: row[field] for field in self.result_fields}
+        self._doc_tokens[doc_id] = tokens
+        for token, weight in tokens.items():
+            if token not in self._postings:
+                bisect.insort(self._vocabulary, token)
+                for gram in trigrams(token):
+                    self._trigrams[gram].add(token)
+            self._postings[token][doc_id] = weight
+
+    def _remove(self, doc_id):
+        self._documents.pop(doc_id, None)
+        for token in self._doc_tokens.pop(doc_id, {}):
+            postings = self._postings[token]
+            postings.pop(doc_id, None)
+            if postings:
+                continue
+            del self._postings[token]
+            del self._vocabulary[bisect.bisect_left(self._vocabulary, token)]
+            for gram in trigrams(token):
+                self._trigrams[gram].discard(token)
+                if not self._trigrams[gram]:
+                    del self._trigrams[gram]
+
+    # Incremental updates
+
+    def update(self, exercise):
+        """Re-index one exercise after it was saved (or soft-deleted)"""
+        with self._lock:
+            if self._built_at is None:
+                return
+            self._remove(exercise.pk)
+            if exercise.is_active:
+                self._add(
+                    {
+                        field: getattr(exercise, field)
+                        for field in set(self.result_fields) | set(self.field_weights)
+                    }
+                )
+
+    def remove(self, exercise_id):
+        with self._lock:
+            if self._built_at is not None:
+                self._remove(exercise_id)
+
+    # Querying
+
+    def _expand_prefix(self, term):
+        start = bisect.bisect_left(self._vocabulary, term)
+        matches = []
+        for token in self._vocabulary[start : start + self.max_prefix_expansions]:
+            if not token.startswith(term):
+                break
+            matches.append(token)
+        return matches
+
+    def _fuzzy_matches(self, term):
+        grams = trigrams(term)
+        shared = defaultdict(int)
+        for gram in grams:
+            for token in self._trigrams.get(gram, ()):
+                shared[token] += 1
+        scored = []
+        for token, count in shared.items():
+            similarity = count / len(grams | trigrams(token))
+            if similarity >= self.min_similarity:
+                scored.append((similarity, token))
+        scored.sort(reverse=True)
+        return scored[: self.max_fuzzy_candidates]
+
+    def _term_scores(self, term, allow_prefix):
+        """Map doc_id -> score for one query term"""
+        scores = {}
+
+        def collect(token, factor):
+            for doc_id, weight in self._postings.get(token, {}).items():
+                score = weight * factor
+                if score > scores.get(doc_id, 0):
+                    scores[doc_id] = score
+
+        collect(term, 1.0)
+        if allow_prefix:
+            for token in self._expand_prefix(term):
+                if token != term:
+                    collect(token, self.prefix_factor * len(term) / len(token))
+        if not scores:
+            for similarity, token in self._fuzzy_matches(term):
+                collect(token, self.fuzzy_factor * similarity)
+        return scores
+
+    def search(self, query, limit=20, prefix=True):
+        """
+        Rank active exercises against `query`. With `prefix` set the last term
+        may be incomplete, which is what typeahead needs.
+        """
+        terms = tokenize(query)
+        if not terms:
+            return []
+        self.ensure_built()
+        with self._lock:
+            totals = None
+            for position, term in enumerate(terms):
+                scores = self._term_scores(
+                    term, allow_prefix=prefix and position == len(terms) - 1
+                )
+                if totals is None:
+                    totals = scores
+                else:
+                    totals = {
+                        doc_id: totals[doc_id] + score
+                        for doc_id, score in scores.items()
+                        if doc_id in totals
+                    }
+                if not totals:
+                    return []
+
+            query_text = " ".join(terms)
+            ranked = sorted(
+                totals.items(),
+                key=lambda item: (
+                    -item[1],
+                    not self._documents[item[0]]["name"].lower().startswith(query_text),
+                    self._documents[item[0]]["name"].lower(),
+                ),
+            )
+            return [
+                dict(self._documents[doc_id], score=round(score, 3))
+                for doc_id, score in ranked[:limit]
+            ]
+
+
+exercise_search_index = ExerciseSearchIndex()
@@ -1,5 +1,6 @@
 from rest_framework import serializers
 from django.contrib.auth import get_user_model
+from django.utils import timezone
 from core.apps.workout.models import (
     WorkoutPlan,
     Exercise,
@@ -7,17 +8,45 @@ from core.apps.workout.models import (
     WorkoutLog,
     MemberProgress,
     WorkoutSession,
+    MuscleGroup,
+    parse_muscle_groups,
 )
 from core.apps.diet.models import NutritionPlan
 from core.apps.diet.serializers.serializers import NutritionPlanSerializer
+from core.apps.users.serializers.serializers import DerivativeURLsField
 
 User = get_user_model()
 
 
 class ExerciseSerializer(serializers.ModelSerializer):
+    exercise_image_urls = DerivativeURLsField(source="exercise_image")
+
     class Meta:
         model = Exercise
-        fields = "__all__"
+        # Derivative state is exposed through exercise_image_urls.
+        exclude = ["exercise_image_derivatives"]
+        read_only_fields = ["targeted_muscles", "muscle_mask"]
+
+    def validate_muscle_groups(self, value):
+        names = parse_muscle_groups(value)
+        if not names:
+            raise serializers.ValidationError("At least one muscle group is required")
+        if any(len(name) > 50 for name in names):
+            raise serializers.ValidationError(
+                "Muscle group names cannot exceed 50 characters"
+            )
+        known = set(
+            MuscleGroup.objects.filter(name__in=names).values_list("name", flat=True)
+        )
+        new_count = len(set(names) - known)
+        if (
+            new_count
+            and MuscleGroup.objects.count() + new_count > MuscleGroup.MAX_GROUPS
+        ):
+            raise serializers.ValidationError(
+                f"Cannot track more than {MuscleGroup.MAX_GROUPS} muscle groups"
+            )
+        return ", ".join(names)
 
     def validate_calories_per_minute(self, value):
         if value is not None and value < 0:
@@ -81,6 +110,27 @@ class WorkoutPlanExerciseSerializer(serializers.ModelSerializer):
         return value
 
 
+class WorkoutPlanExerciseItemSerializer(WorkoutPlanExerciseSerializer):
+    """
+    One row of a plan's complete exercise list. Rows with an id update that
+    row, rows without one are created; order is taken from the list position.
+    """
+
+    id = serializers.IntegerField(required=False)
+    exercise = serializers.IntegerField(source="exercise_id")
+
+    class Meta(WorkoutPlanExerciseSerializer.Meta):
+        fields = [
+            "id",
+            "exercise",
+            "sets",
+            "reps",
+            "weight",
+            "rest_time_seconds",
+            "notes",
+        ]
+
+
 class WorkoutPlanSerializer(serializers.ModelSerializer):
     trainer_name = serializers.CharField(source="trainer.username", read_only=True)
     member_name = serializers.CharField(source="member.username", read_only=True)
@@ -127,6 +177,23 @@ class WorkoutPlanSerializer(serializers.ModelSerializer):
         return value.strip()
 
 
+class TodaysPlanExerciseSerializer(WorkoutPlanExerciseSerializer):
+    last_weight_used = serializers.FloatField(read_only=True)
+    last_logged_date = serializers.DateField(read_only=True)
+
+    class Meta(WorkoutPlanExerciseSerializer.Meta):
+        fields = WorkoutPlanExerciseSerializer.Meta.fields + [
+            "last_weight_used",
+            "last_logged_date",
+        ]
+
+
+class TodaysWorkoutPlanSerializer(WorkoutPlanSerializer):
+    """A plan with each exercise's last logged weight for the plan's member"""
+
+    plan_exercises = TodaysPlanExerciseSerializer(many=True, read_only=True)
+
+
 class WorkoutLogSerializer(serializers.ModelSerializer):
     member_name = serializers.CharField(source="member.username", read_only=True)
     exercise_name = serializers.CharField(source="exercise.name", read_only=True)
@@ -142,6 +209,7 @@ class WorkoutLogSerializer(serializers.ModelSerializer):
             "member_name",
             "workout_plan",
             "workout_plan_name",
+            "session",
             "exercise",
             "exercise_name",
             "date",
@@ -173,9 +241,67 @@ class WorkoutLogSerializer(serializers.ModelSerializer):
             raise serializers.ValidationError("Duration must be greater than 0 minutes")
         return value
 
+    def validate(self, attrs):
+        session = attrs.get("session")
+        if session is None:
+            return attrs
+        member = attrs.get("member", getattr(self.instance, "member", None))
+        plan = attrs.get("workout_plan", getattr(self.instance, "workout_plan", None))
+        error = session.log_error(
+            getattr(member, "id", None), getattr(plan, "id", None)
+        )
+        if error:
+            raise serializers.ValidationError({"session": [error]})
+        if plan is None:
+            attrs["workout_plan"] = session.workout_plan
+        return attrs
+
+
+class WorkoutLogBatchItemSerializer(WorkoutLogSerializer):
+    """
+    One entry of a batch upload. Foreign keys are taken as plain ids so that
+    validating an entry does not hit the database; the view resolves them for
+    the whole batch at once.
+    """
+
+    member = serializers.IntegerField(source="member_id", required=False)
+    workout_plan = serializers.IntegerField(
+        source="workout_plan_id", required=False, allow_null=True
+    )
+    session = serializers.IntegerField(
+        source="session_id", required=False, allow_null=True
+    )
+    exercise = serializers.IntegerField(source="exercise_id")
+    date = serializers.DateField(required=False)
+
+    class Meta(WorkoutLogSerializer.Meta):
+        fields = [
+            "member",
+            "workout_plan",
+            "session",
+            "exercise",
+            "date",
+            "sets_completed",
+            "reps_completed",
+            "weight_used",
+            "notes",
+            "duration_minutes",
+        ]
+        read_only_fields = []
+
+    def validate(self, attrs):
+        # Sessions are checked by the view for the whole batch at once.
+        return attrs
+
+    def validate_date(self, value):
+        if value > timezone.localdate():
+            raise serializers.ValidationError("Date cannot be in the future")
+        return value
+
 
 class MemberProgressSerializer(serializers.ModelSerializer):
     member_name = serializers.CharField(source="member.username", read_only=True)
+    progress_photos_urls = DerivativeURLsField(source="progress_photos")
 
     class Meta:
         model = MemberProgress
@@ -188,6 +314,7 @@ class MemberProgressSerializer(serializers.ModelSerializer):
             "muscle_mass",
             "measurements",
             "progress_photos",
+            "progress_photos_urls",
             "notes",
             "recorded_date",
         ]
@@ -232,13 +359,22 @@ class WorkoutSessionSerializer(serializers.ModelSerializer):
             "start_time",
             "end_time",
             "total_calories_burned",
+            "active_minutes",
+            "total_volume",
             "status",
             "rating",
             "feedback",
             "created_date",
             "duration_minutes",
         ]
-        read_only_fields = ["created_date", "duration_minutes"]
+        # Totals are computed from the session's logs by the complete action.
+        read_only_fields = [
+            "created_date",
+            "duration_minutes",
+            "total_calories_burned",
+            "active_minutes",
+            "total_volume",
+        ]
 
     def validate(self, data):
         if "end_time" in data and data["end_time"] and "start_time" in data:
@@ -246,11 +382,6 @@ class WorkoutSessionSerializer(serializers.ModelSerializer):
                 raise serializers.ValidationError("End time must be after start time")
         return data
 
-    def validate_total_calories_burned(self, value):
-        if value is not None and value < 0:
-            raise serializers.ValidationError("Calories burned cannot be negative")
-        return value
-
     def validate_rating(self, value):
         if value is not None:
             if value < 1 or value > 5:
@@ -258,6 +389,20 @@ class WorkoutSessionSerializer(serializers.ModelSerializer):
         return value
 
 
+class WorkoutSessionCompleteSerializer(WorkoutSessionSerializer):
+    """Input of the complete action; end_time defaults to now"""
+
+    class Meta(WorkoutSessionSerializer.Meta):
+        fields = ["end_time", "rating", "feedback"]
+        read_only_fields = []
+
+    def validate(self, data):
+        end_time = data.get("end_time")
+        if end_time and end_time <= self.instance.start_time:
+            raise serializers.ValidationError("End time must be after start time")
+        return data
+
+
 class NutritionPlanSerializer(serializers.ModelSerializer):
     class Meta:
         model = NutritionPlan
@@ -0,0 +1,128 @@
+from django.db.models.signals import post_delete, post_save, pre_save
+from django.dispatch import receiver
+
+from core.apps.diet.models import NutritionPlan
+from core.apps.users.caching.caching import bump_version
+from core.apps.users.images.images import track_image_fields
+from core.apps.workout.analytics.analytics import invalidate_training_analytics
+from core.apps.workout.models import (
+    DailyTrainingSummary,
+    Exercise,
+    MemberProgress,
+    WorkoutLog,
+    WorkoutPlan,
+    WorkoutPlanExercise,
+)
+from core.apps.workout.search.search import exercise_search_index
+from core.apps.workout.today.today import invalidate_todays_workout
+
+
+@receiver(pre_save, sender=WorkoutLog)
+def remember_previous_summary_key(sender, instance, raw=False, **kwargs):
+    """Note the (member, date) a log belonged to before an edit moves it"""
+    instance._previous_summary_key = None
+    if raw or instance.pk is None:
+        return
+    # A locking read, so the transaction's snapshot is only taken once
+    # DailyTrainingSummary.objects.refresh() holds the summary row locks.
+    instance._previous_summary_key = (
+        WorkoutLog.objects.select_for_update()
+        .filter(pk=instance.pk)
+        .values_list("member_id", "date")
+        .first()
+    )
+
+
+@receiver(post_save, sender=WorkoutLog)
+def refresh_summary_on_save(sender, instance, raw=False, **kwargs):
+    if raw or getattr(instance, "_summary_refreshed_by_caller", False):
+        return
+    keys = {(instance.member_id, instance.date)}
+    previous = getattr(instance, "_previous_summary_key", None)
+    if previous:
+        keys.add(previous)
+    DailyTrainingSummary.objects.refresh(keys)
+
+
+@receiver(post_delete, sender=WorkoutLog)
+def refresh_summary_on_delete(sender, instance, **kwargs):
+    DailyTrainingSummary.objects.refresh({(instance.member_id, instance.date)})
+
+
+@receiver(post_save, sender=Exercise)
+def reindex_exercise_on_save(sender, instance, raw=False, **kwargs):
+    if not raw:
+        exercise_search_index.update(instance)
+        bump_version("exercises")
+
+
+@receiver(post_delete, sender=Exercise)
+def unindex_exercise_on_delete(sender, instance, **kwargs):
+    exercise_search_index.remove(instance.pk)
+    bump_version("exercises")
+
+
+@receiver(post_save, sender=WorkoutPlan)
+@receiver(post_delete, sender=WorkoutPlan)
+@receiver(post_save, sender=WorkoutPlanExercise)
+@receiver(post_delete, sender=WorkoutPlanExercise)
+@receiver(post_save, sender=Exercise)
+@receiver(post_delete, sender=Exercise)
+@receiver(post_save, sender=NutritionPlan)
+@receiver(post_delete, sender=NutritionPlan)
+def invalidate_recommendations(sender, raw=False, **kwargs):
+    if not raw:
+        bump_version("recommendations")
+
+
+@receiver(pre_save, sender=WorkoutPlan)
+def remember_previous_plan_member(sender, instance, raw=False, **kwargs):
+    """Note the member a plan belonged to before an edit reassigns it"""
+    instance._previous_member_id = None
+    if raw or instance.pk is None:
+        return
+    instance._previous_member_id = (
+        WorkoutPlan.objects.filter(pk=instance.pk)
+        .values_list("member_id", flat=True)
+        .first()
+    )
+
+
+@receiver(post_save, sender=WorkoutPlan)
+@receiver(post_delete, sender=WorkoutPlan)
+def invalidate_plan_member_workout(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_todays_workout(
+            instance.member_id, getattr(instance, "_previous_member_id", None)
+        )
+
+
+@receiver(post_save, sender=WorkoutPlanExercise)
+@receiver(post_delete, sender=WorkoutPlanExercise)
+def invalidate_plan_exercise_member_workout(sender, instance, raw=False, **kwargs):
+    if not raw:
+        invalidate_todays_workout(instance.workout_plan.member_id)
+
+
+@receiver(post_save, sender=WorkoutLog)
+@receiver(post_delete, sender=WorkoutLog)
+def invalidate_log_member_workout(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_previous_summary_key", None)
+    invalidate_todays_workout(instance.member_id, previous[0] if previous else None)
+
+
+@receiver(post_save, sender=WorkoutLog)
+@receiver(post_delete, sender=WorkoutLog)
+def invalidate_log_member_analytics(sender, instance, raw=False, **kwargs):
+    if raw:
+        return
+    previous = getattr(instance, "_previous_summary_key", None)
+    invalidate_training_analytics(instance.member_id, previous[0] if previous else None)
+
+
+track_image_fields(
+    Exercise, ["exercise_image"], on_ready=lambda: bump_version("exercises")
+)
+track_image_fields(MemberProgress, ["progress_photos"])
@@ -1,3 +1,296 @@
-# from django.test import TestCase
+import datetime
+from unittest import mock
 
-# Create your tests here.
+from django.core.cache import cache
+from django.db import connection
+from django.test import TestCase
+from django.utils import timezone
+from rest_framework.test import APIClient
+
+from core.apps.users.models import User
+from core.apps.workout.models import (
+    DailyTrainingSummary,
+    Exercise,
+    WorkoutLog,
+    WorkoutPlan,
+    WorkoutPlanExercise,
+    WorkoutSession,
+)
+
+
+class DailyTrainingSummarySignalTests(TestCase):
+    @classmethod
+    def setUpTestData(cls):
+        cls.member = User.objects.create(username="member", role="member")
+        cls.exercise = Exercise.objects.create(
+            name="Squat", category="legs", muscle_groups="legs"
+        )
+        cls.day = datetime.date(2026, 3, 2)
+
+    def log(self, **kwargs):
+        fields = {
+            "member": self.member,
+            "exercise": self.exercise,
+            "date": self.day,
+            "sets_completed": 3,
+            "reps_completed": 5,
+            "weight_used": 100.0,
+        }
+        fields.update(kwargs)
+        return WorkoutLog.objects.create(**fields)
+
+    def summary(self, day=None):
+        return DailyTrainingSummary.objects.filter(
+            member=self.member, date=day or self.day
+        ).first()
+
+    def test_save_and_delete_keep_summary_in_sync(self):
+        first = self.log()
+        self.log(reps_completed=2, weight_used=None, duration_minutes=10)
+
+        summary = self.summary()
+        self.assertEqual(summary.log_count, 2)
+        self.assertEqual(summary.total_reps, 21)
+        self.assertEqual(summary.total_volume, 1500.0)
+        self.assertEqual(summary.total_minutes, 10)
+
+        first.delete()
+        summary = self.summary()
+        self.assertEqual(summary.log_count, 1)
+        self.assertEqual(summary.total_volume, 0.0)
+
+    def test_moving_a_log_refreshes_both_days(self):
+        log = self.log()
+        next_day = self.day + datetime.timedelta(days=1)
+
+        log.date = next_day
+        log.save()
+
+        self.assertIsNone(self.summary())
+        self.assertEqual(self.summary(next_day).log_count, 1)
+
+    def test_upsert_omits_conflict_target_when_unsupported(self):
+        self.log()
+        features = type(connection.features)
+        with mock.patch.object(
+            features, "supports_update_conflicts_with_target", False
+        ), mock.patch.object(
+            DailyTrainingSummary.objects.get_queryset().__class__,
+            "bulk_create",
+            autospec=True,
+        ) as bulk_create:
+            DailyTrainingSummary.objects.refresh({(self.member.id, self.day)})
+
+        self.assertTrue(bulk_create.called)
+        self.assertNotIn("unique_fields", bulk_create.call_args.kwargs)
+        self.assertTrue(bulk_create.call_args.kwargs["update_conflicts"])
+
+
+class TrainingAnalyticsTests(TestCase):
+    def setUp(self):
+        cache.clear()
+        self.member = User.objects.create(username="member", role="member")
+        self.exercise = Exercise.objects.create(
+            name="Push-up", category="chest", muscle_groups="chest"
+        )
+
+    def test_zero_weight_logs_are_treated_as_bodyweight(self):
+        for day, weight in ((1, 0.0), (8, 20.0), (9, 0.0)):
+            WorkoutLog.objects.create(
+                member=self.member,
+                exercise=self.exercise,
+                date=datetime.date(2026, 3, day),
+                sets_completed=3,
+                reps_completed=10,
+                weight_used=weight,
+            )
+        client = APIClient()
+        client.force_authenticate(self.member)
+
+        response = client.get("/workout-logs/analytics/")
+
+        self.assertEqual(response.status_code, 200)
+        (exercise,) = response.json()["members"][0]["exercises"]
+        self.assertEqual([point["e1rm"] for point in exercise["e1rm_curve"]], [26.67])
+        self.assertEqual(
+            [point["intensity"] for point in exercise["intensity_curve"]], [0.75]
+        )
+
+    def test_editing_an_older_log_refreshes_the_report(self):
+        first, _ = [
+            WorkoutLog.objects.create(
+                member=self.member,
+                exercise=self.exercise,
+                date=datetime.date(2026, 3, day),
+                sets_completed=3,
+                reps_completed=1,
+                weight_used=weight,
+            )
+            for day, weight in ((2, 100.0), (9, 50.0))
+        ]
+        client = APIClient()
+        client.force_authenticate(self.member)
+
+        def best():
+            response = client.get("/workout-logs/analytics/")
+            return response.json()["members"][0]["exercises"][0]["estimated_1rm"]
+
+        self.assertEqual(best(), 100.0)
+        with self.captureOnCommitCallbacks(execute=True):
+            first.weight_used = 80.0
+            first.save()
+        self.assertEqual(best(), 80.0)
+        with self.captureOnCommitCallbacks(execute=True):
+            first.delete()
+        self.assertEqual(best(), 50.0)
+
+
+class WorkoutSessionLogTests(TestCase):
+    def setUp(self):
+        trainer = User.objects.create(username="trainer", role="trainer")
+        self.member = User.objects.create(username="member", role="member")
+        self.exercise = Exercise.objects.create(
+            name="Squat", category="legs", muscle_groups="legs"
+        )
+        self.plan = WorkoutPlan.objects.create(
+            trainer=trainer,
+            member=self.member,
+            name="Legs",
+            description="Leg day",
+            goal="strength",
+            day_of_week="monday",
+        )
+        start = timezone.now() - datetime.timedelta(hours=1)
+        self.session = WorkoutSession.objects.create(
+            member=self.member, workout_plan=self.plan, start_time=start
+        )
+        self.client = APIClient()
+        self.client.force_authenticate(self.member)
+
+    def entry(self, **kwargs):
+        return {
+            "exercise": self.exercise.id,
+            "sets_completed": 3,
+            "reps_completed": 10,
+            "weight_used": 50.0,
+            **kwargs,
+        }
+
+    def test_totals_only_count_logs_of_the_session(self):
+        response = self.client.post(
+            "/workout-logs/", self.entry(member=self.member.id, session=self.session.id)
+        )
+        self.assertEqual(response.status_code, 201)
+        self.assertEqual(response.json()["workout_plan"], self.plan.id)
+        response = self.client.post(
+            "/workout-logs/batch/",
+            [
+                self.entry(session=self.session.id),
+                self.entry(workout_plan=self.plan.id),
+            ],
+            format="json",
+        )
+        self.assertEqual(response.status_code, 201)
+
+        self.session.complete()
+
+        self.assertEqual(self.session.total_volume, 3000.0)
+        self.assertEqual(
+            WorkoutLog.objects.filter(session=self.session).count(),
+            2,
+        )
+
+    def test_batch_returns_the_created_ids(self):
+        features = type(connection.features)
+        for returns_ids in (True, False):
+            with self.subTest(returns_ids=returns_ids), mock.patch.object(
+                features, "can_return_rows_from_bulk_insert", returns_ids
+            ):
+                response = self.client.post(
+                    "/workout-logs/batch/",
+                    [self.entry(reps_completed=reps) for reps in (8, 9)],
+                    format="json",
+                )
+
+                self.assertEqual(response.status_code, 201)
+                ids = [result["id"] for result in response.json()["results"]]
+                self.assertNotIn(None, ids)
+                self.assertEqual(
+                    list(
+                        WorkoutLog.objects.filter(id__in=ids)
+                        .order_by("id")
+                        .values_list("reps_completed", flat=True)
+                    ),
+                    [8, 9],
+                )
+                self.assertEqual(
+                    DailyTrainingSummary.objects.get(
+                        member=self.member, date=timezone.localdate()
+                    ).log_count,
+                    2 if returns_ids else 4,
+                )
+
+    def test_export_includes_the_session(self):
+        WorkoutLog.objects.create(
+            member=self.member,
+            workout_plan=self.plan,
+            session=self.session,
+            exercise=self.exercise,
+            sets_completed=3,
+            reps_completed=10,
+        )
+
+        response = self.client.get("/workout-logs/export/", {"output": "csv"})
+
+        header, row = b"".join(response.streaming_content).decode().splitlines()
+        column = header.split(",").index("session_id")
+        self.assertEqual(row.split(",")[column], str(self.session.id))
+
+    def test_logs_cannot_join_another_members_session(self):
+        other = User.objects.create(username="other", role="member")
+        session = WorkoutSession.objects.create(
+            member=other, workout_plan=self.plan, start_time=timezone.now()
+        )
+
+        response = self.client.post(
+            "/workout-logs/batch/", [self.entry(session=session.id)], format="json"
+        )
+
+        self.assertEqual(response.status_code, 400)
+        self.assertIn("session", response.json()["results"][0]["errors"])
+
+
+class WorkoutPlanCloneTests(TestCase):
+    def test_clone_without_bulk_insert_ids(self):
+        trainer = User.objects.create(username="trainer", role="trainer")
+        members = [
+            User.objects.create(username=f"member{i}", role="member") for i in range(3)
+        ]
+        plan = WorkoutPlan.objects.create(
+            trainer=trainer,
+            member=members[0],
+            name="Legs",
+            description="Leg day",
+            goal="strength",
+            day_of_week="monday",
+        )
+        exercise = Exercise.objects.create(
+            name="Squat", category="legs", muscle_groups="legs"
+        )
+        WorkoutPlanExercise.objects.create(
+            workout_plan=plan, exercise=exercise, sets=5, reps=5, order=1
+        )
+        features = type(connection.features)
+
+        with mock.patch.object(features, "can_return_rows_from_bulk_insert", False):
+            clones = plan.clone_to([member.id for member in members[1:]])
+
+        self.assertEqual(
+            [(clone.member_id, clone.name) for clone in clones],
+            [(member.id, "Legs") for member in members[1:]],
+        )
+        for clone in clones:
+            self.assertEqual(
+                list(clone.plan_exercises.values_list("exercise_id", "sets")),
+                [(exercise.id, 5)],
+            )
@@ -0,0 +1,87 @@
+import zoneinfo
+
+from django.conf import settings
+from django.core.cache import cache
+from django.db.models import OuterRef, Prefetch, Subquery
+from django.utils import timezone
+
+from core.apps.users.caching.caching import bump_version, get_version
+from core.apps.workout.models import WorkoutLog, WorkoutPlan, WorkoutPlanExercise
+from core.apps.workout.serializers.serializers import TodaysWorkoutPlanSerializer
+
+CACHE_TIMEOUT = 60 * 60 * 24
+# WorkoutPlan.day_of_week values indexed by date.weekday(); strftime("%A")
+# would follow the process locale.
+DAY_NAMES = (
+    "monday",
+    "tuesday",
+    "wednesday",
+    "thursday",
+    "friday",
+    "saturday",
+    "sunday",
+)
+
+
+def _namespace(member_id):
+    return f"todays-workout:{member_id}"
+
+
+def invalidate_todays_workout(*member_ids):
+    """Drop the cached workouts of `member_ids` once the transaction commits"""
+    for member_id in set(member_ids):
+        if member_id is not None:
+            bump_version(_namespace(member_id))
+
+
+def get_timezone(name):
+    """The IANA zone `name`, or the site time zone when none is given"""
+    return zoneinfo.ZoneInfo(name or settings.TIME_ZONE)
+
+
+def _build(member_id, day_of_week):
+    last_log = WorkoutLog.objects.filter(
+        member_id=member_id,
+        exercise_id=OuterRef("exercise_id"),
+        weight_used__isnull=False,
+    ).order_by("-date", "-id")
+    plans = (
+        WorkoutPlan.objects.select_related("trainer", "member")
+        .prefetch_related(
+            Prefetch(
+                "plan_exercises",
+                queryset=WorkoutPlanExercise.objects.select_related("exercise")
+                .annotate(
+                    last_weight_used=Subquery(last_log.values("weight_used")[:1]),
+                    last_logged_date=Subquery(last_log.values("date")[:1]),
+                )
+                .order_by("order", "id"),
+            )
+        )
+        .filter(member_id=member_id, is_active=True, day_of_week=day_of_week)
+        .order_by("id")
+    )
+    return list(TodaysWorkoutPlanSerializer(plans, many=True).data)
+
+
+def todays_workout(member_id, tz):
+    """
+    The member's active plans for the current weekday in `tz`, with each
+    exercise's last logged weight. Cached per member and weekday until a plan,
+    plan exercise, exercise or workout log of theirs changes.
+    """
+    today = timezone.localdate(timezone=tz)
+    day_of_week = DAY_NAMES[today.weekday()]
+    key = ":".join(
+        [
+            _namespace(member_id),
+            str(get_version(_namespace(member_id))),
+            str(get_version("exercises")),
+            day_of_week,
+        ]
+    )
+    plans = cache.get(key)
+    if plans is None:
+        plans = _build(member_id, day_of_week)
+        cache.set(key, plans, CACHE_TIMEOUT)
+    return {"date": today, "day_of_week": day_of_week, "plans": plans}
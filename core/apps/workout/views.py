@@ -1,11 +1,20 @@
+import zoneinfo
+
 from rest_framework import viewsets, status
 from rest_framework.response import Response
 from rest_framework.decorators import action
-from django.db.models import Q
+from django.db import connection, transaction
 
 # from django.shortcuts import get_object_or_404
 from django.contrib.auth import get_user_model
+from core.apps.users.caching.caching import bump_version
+from core.apps.users.mixins.mixins import (
+    RoleScopedQuerysetMixin,
+    StreamingExportMixin,
+    VersionedListCacheMixin,
+)
 from core.apps.users.models import TrainerMember
+from core.apps.users.pagination.pagination import WorkoutLogCursorPagination
 from core.apps.users.permissions.permissisons import (
     IsSuperAdmin,
     IsAdmin,
@@ -19,28 +28,66 @@ from core.apps.workout.models import (
     WorkoutLog,
     MemberProgress,
     WorkoutSession,
+    DailyTrainingSummary,
+    MuscleGroup,
+    parse_muscle_groups,
+)
+from core.apps.workout.analytics.analytics import (
+    invalidate_training_analytics,
+    training_analytics,
+)
+from core.apps.workout.dashboard.dashboard import trainer_dashboard
+from core.apps.workout.recommendations.recommendations import (
+    bmi_category,
+    recommend,
+)
+from core.apps.workout.search.search import exercise_search_index
+from core.apps.workout.today.today import (
+    get_timezone,
+    invalidate_todays_workout,
+    todays_workout,
 )
 from core.apps.workout.serializers.serializers import (
     WorkoutPlanSerializer,
     ExerciseSerializer,
     WorkoutPlanExerciseSerializer,
+    WorkoutPlanExerciseItemSerializer,
     WorkoutLogSerializer,
+    WorkoutLogBatchItemSerializer,
     MemberProgressSerializer,
     WorkoutSessionSerializer,
+    WorkoutSessionCompleteSerializer,
 )
-from core.apps.diet.models import NutritionPlan
-from core.apps.diet.serializers.serializers import NutritionPlanSerializer
 
 User = get_user_model()
 
 
 # Exercise ViewSet
-class ExerciseViewSet(viewsets.ModelViewSet):
+class ExerciseViewSet(VersionedListCacheMixin, viewsets.ModelViewSet):
     serializer_class = ExerciseSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
 
+    filter_fields = {
+        "category": "category",
+        "difficulty_level": "difficulty_level",
+    }
+    ordering_fields = ["id", "name"]
+    ordering = ["id"]
+    list_cache_namespace = "exercises"
+
     def get_queryset(self):
-        return Exercise.objects.filter(is_active=True).select_related()
+        queryset = Exercise.objects.filter(is_active=True).select_related()
+        muscles = self.request.query_params.get("muscles")
+        if muscles:
+            # ?muscles=chest,triceps&muscle_match=any|all
+            names = parse_muscle_groups(muscles)
+            match_all = self.request.query_params.get("muscle_match") == "all"
+            mask = MuscleGroup.objects.mask_for(names)
+            if match_all and bin(mask).count("1") < len(names):
+                # A muscle nobody targets yet can never be matched.
+                return queryset.none()
+            queryset = queryset.targeting(mask, match_all=match_all)
+        return queryset
 
     def destroy(self, request, *args, **kwargs):
         instance = self.get_object()
@@ -48,27 +95,65 @@ class ExerciseViewSet(viewsets.ModelViewSet):
         instance.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    search_max_limit = 50
+
+    def _search(self, request, default_limit, prefix):
+        query = request.query_params.get("q", "").strip()
+        try:
+            limit = int(request.query_params.get("limit", default_limit))
+        except ValueError:
+            return Response(
+                {"error": "limit must be an integer."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        limit = max(1, min(limit, self.search_max_limit))
+        results = exercise_search_index.search(query, limit=limit, prefix=prefix)
+        return Response({"query": query, "results": results})
+
+    @action(detail=False, methods=["get"], url_path="search")
+    def search(self, request):
+        """Ranked search over name, muscle groups, equipment and description"""
+        return self._search(request, default_limit=20, prefix=False)
+
+    @action(detail=False, methods=["get"], url_path="autocomplete")
+    def autocomplete(self, request):
+        """Typeahead: like search, but the last word may be a prefix"""
+        return self._search(request, default_limit=10, prefix=True)
+
 
 # WorkoutPlan ViewSet
 class WorkoutPlanViewSet(viewsets.ModelViewSet):
     serializer_class = WorkoutPlanSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
 
+    filter_fields = {
+        "member": "member",
+        "trainer": "trainer",
+        "goal": "goal",
+        "day_of_week": "day_of_week",
+    }
+    ordering_fields = ["id"]
+    ordering = ["-id"]
+
     def get_queryset(self):
         user = self.request.user
+        queryset = WorkoutPlan.objects.with_details()
         if user.role == "admin":
-            return WorkoutPlan.objects.filter(is_active=True).select_related()
+            return queryset.filter(is_active=True)
         elif user.role == "trainer":
-            return WorkoutPlan.objects.filter(
-                trainer=user, is_active=True
-            ).select_related()
+            return queryset.filter(trainer=user, is_active=True)
         else:
-            return WorkoutPlan.objects.filter(
-                member=user, is_active=True
-            ).select_related()
+            return queryset.filter(member=user, is_active=True)
 
     def get_permissions(self):
-        if self.action in ["create", "update", "partial_update", "destroy"]:
+        if self.action in [
+            "create",
+            "update",
+            "partial_update",
+            "destroy",
+            "clone",
+            "replace_exercises",
+        ]:
             permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
         else:
             permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
@@ -80,57 +165,419 @@ class WorkoutPlanViewSet(viewsets.ModelViewSet):
         instance.save()
         return Response(status=status.HTTP_204_NO_CONTENT)
 
+    @action(detail=False, methods=["get"], url_path="today")
+    def today(self, request):
+        """
+        Today's plans for a member with the last logged weight per exercise.
+        `tz` is the member's IANA time zone; trainers and admins pass `member`.
+        """
+        user = request.user
+        try:
+            tz = get_timezone(request.query_params.get("tz"))
+        except (zoneinfo.ZoneInfoNotFoundError, ValueError):
+            return Response(
+                {"error": "tz must be a valid IANA time zone name."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if user.role == "member":
+            member_id = user.id
+        else:
+            try:
+                member_id = int(request.query_params.get("member", ""))
+            except ValueError:
+                return Response(
+                    {"error": "A member id is required."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+            if (
+                user.role == "trainer"
+                and not TrainerMember.objects.active_for(user)
+                .filter(member_id=member_id)
+                .exists()
+            ):
+                return Response(
+                    {"error": "You cannot view this member's workouts."},
+                    status=status.HTTP_403_FORBIDDEN,
+                )
+        return Response(todays_workout(member_id, tz))
+
+    @action(detail=True, methods=["put"], url_path="exercises")
+    def replace_exercises(self, request, pk=None):
+        """
+        Replace the plan's exercises with the complete ordered list sent, in
+        one transaction, and return the updated plan
+        """
+        plan = self.get_object()
+        items = request.data
+        if isinstance(items, dict):
+            items = items.get("exercises")
+        if not isinstance(items, list):
+            return Response(
+                {"error": "A list of plan exercises is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        serializer = WorkoutPlanExerciseItemSerializer(data=items, many=True)
+        serializer.is_valid(raise_exception=True)
+        items = serializer.validated_data
+
+        exercise_ids = {item["exercise_id"] for item in items}
+        found = set(
+            Exercise.objects.filter(id__in=exercise_ids).values_list("id", flat=True)
+        )
+        if exercise_ids - found:
+            return Response(
+                {"error": f"Exercises not found: {sorted(exercise_ids - found)}."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        try:
+            plan.replace_exercises(items)
+        except ValueError as e:
+            return Response({"error": str(e)}, status=status.HTTP_400_BAD_REQUEST)
+        # Bulk writes skip the save signals that invalidate cached responses.
+        bump_version("recommendations")
+        invalidate_todays_workout(plan.member_id)
+        plan = WorkoutPlan.objects.with_details().get(pk=plan.pk)
+        return Response(WorkoutPlanSerializer(plan).data)
+
+    clone_max_members = 500
+
+    @action(detail=True, methods=["post"], url_path="clone")
+    def clone(self, request, pk=None):
+        """Copy this plan and its exercises to every member in `members`"""
+        plan = self.get_object()
+        member_ids = request.data.get("members")
+        if (
+            not isinstance(member_ids, list)
+            or not member_ids
+            or not all(
+                isinstance(member_id, int) and not isinstance(member_id, bool)
+                for member_id in member_ids
+            )
+        ):
+            return Response(
+                {"error": "members must be a non-empty list of member ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        member_ids = list(dict.fromkeys(member_ids))
+        if len(member_ids) > self.clone_max_members:
+            return Response(
+                {
+                    "error": f"A plan cannot be cloned to more than {self.clone_max_members} members at once."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        # One query decides which of the members the user may assign plans to.
+        if user.role == "trainer":
+            trainer = user
+            allowed = set(
+                TrainerMember.objects.active_for(user)
+                .filter(member_id__in=member_ids)
+                .values_list("member_id", flat=True)
+            )
+        else:
+            trainer = plan.trainer
+            allowed = set(
+                User.objects.filter(
+                    id__in=member_ids, role="member", is_deleted=False
+                ).values_list("id", flat=True)
+            )
+        denied = [member_id for member_id in member_ids if member_id not in allowed]
+        if denied:
+            return Response(
+                {"error": f"You cannot assign plans to members {denied}."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+
+        plans = plan.clone_to(member_ids, trainer=trainer)
+        # bulk_create skips the save signals that invalidate cached responses.
+        bump_version("recommendations")
+        invalidate_todays_workout(*member_ids)
+        return Response(
+            {
+                "created": len(plans),
+                "plans": [
+                    {"member": new_plan.member_id, "id": new_plan.pk}
+                    for new_plan in plans
+                ],
+            },
+            status=status.HTTP_201_CREATED,
+        )
+
 
 # WorkoutPlanExercise ViewSet
 class WorkoutPlanExerciseViewSet(viewsets.ModelViewSet):
     serializer_class = WorkoutPlanExerciseSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
 
+    filter_fields = {
+        "workout_plan_id": "workout_plan",
+        "exercise": "exercise",
+    }
+    ordering_fields = ["order", "id"]
+    ordering = ["workout_plan", "order", "id"]
+
     def get_queryset(self):
-        workout_plan_id = self.request.query_params.get("workout_plan_id")
-        if workout_plan_id:
-            return WorkoutPlanExercise.objects.filter(
-                workout_plan_id=workout_plan_id
-            ).select_related()
         return WorkoutPlanExercise.objects.all().select_related()
 
 
 # WorkoutLog ViewSet
-class WorkoutLogViewSet(viewsets.ModelViewSet):
+class WorkoutLogViewSet(
+    RoleScopedQuerysetMixin, StreamingExportMixin, viewsets.ModelViewSet
+):
     serializer_class = WorkoutLogSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
+    pagination_class = WorkoutLogCursorPagination
+    export_filename = "workout_logs"
+    export_fields = [
+        "id",
+        "member_id",
+        "member__username",
+        "workout_plan_id",
+        "session_id",
+        "exercise_id",
+        "exercise__name",
+        "date",
+        "sets_completed",
+        "reps_completed",
+        "weight_used",
+        "duration_minutes",
+        "notes",
+    ]
+    filter_fields = {
+        "member": "member",
+        "exercise": "exercise",
+        "workout_plan": "workout_plan",
+        "session": "session",
+    }
+    range_filter_fields = {"date": "date"}
+    # Keyset pagination fixes the order to (date, id).
+    ordering_fields = []
 
     def get_queryset(self):
-        user = self.request.user
-        if user.role == "admin":
-            return WorkoutLog.objects.all().select_related()
-        elif user.role == "trainer":
-            member_ids = TrainerMember.objects.filter(
-                trainer=user, is_active=True, is_deleted=False
-            ).values_list("member_id", flat=True)
-            return WorkoutLog.objects.filter(member_id__in=member_ids).select_related()
+        return self.scope_queryset(WorkoutLog.objects.all().select_related())
+
+    batch_max_size = 500
+
+    @action(detail=False, methods=["post"], url_path="batch")
+    def batch(self, request):
+        """Create many workout logs in one request, reporting a result per entry"""
+        entries = request.data
+        if isinstance(entries, dict):
+            entries = entries.get("logs")
+        if not isinstance(entries, list) or not entries:
+            return Response(
+                {"error": "A non-empty list of log entries is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(entries) > self.batch_max_size:
+            return Response(
+                {
+                    "error": f"A batch cannot contain more than {self.batch_max_size} entries."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        user = request.user
+        results = [None] * len(entries)
+
+        # Field-level validation only; nothing here touches the database.
+        validated = []
+        for index, entry in enumerate(entries):
+            serializer = WorkoutLogBatchItemSerializer(data=entry)
+            if not serializer.is_valid():
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "errors": serializer.errors,
+                }
+                continue
+            data = serializer.validated_data
+            if user.role == "member":
+                data.setdefault("member_id", user.id)
+            elif "member_id" not in data:
+                results[index] = {
+                    "index": index,
+                    "status": "error",
+                    "errors": {"member": ["This field is required."]},
+                }
+                continue
+            validated.append((index, data))
+
+        # Resolve members, exercises, plans and sessions with one query each.
+        member_ids = self._get_loggable_member_ids(
+            {data["member_id"] for _, data in validated}
+        )
+        exercise_ids = set(
+            Exercise.objects.filter(
+                id__in={data["exercise_id"] for _, data in validated},
+                is_active=True,
+            ).values_list("id", flat=True)
+        )
+        plan_members = dict(
+            WorkoutPlan.objects.filter(
+                id__in={
+                    data["workout_plan_id"]
+                    for _, data in validated
+                    if data.get("workout_plan_id") is not None
+                }
+            ).values_list("id", "member_id")
+        )
+        sessions = WorkoutSession.objects.only(
+            "id", "member_id", "workout_plan_id", "status"
+        ).in_bulk(
+            {
+                data["session_id"]
+                for _, data in validated
+                if data.get("session_id") is not None
+            }
+        )
+
+        logs = []
+        log_indexes = []
+        for index, data in validated:
+            errors = {}
+            if data["member_id"] not in member_ids:
+                errors["member"] = ["You cannot log workouts for this member."]
+            if data["exercise_id"] not in exercise_ids:
+                errors["exercise"] = ["Exercise not found."]
+            plan_id = data.get("workout_plan_id")
+            if plan_id is not None and plan_members.get(plan_id) != data["member_id"]:
+                errors["workout_plan"] = ["Workout plan not found for this member."]
+            session_id = data.get("session_id")
+            if session_id is not None:
+                session = sessions.get(session_id)
+                error = (
+                    session.log_error(data["member_id"], plan_id)
+                    if session
+                    else "Workout session not found."
+                )
+                if error:
+                    errors["session"] = [error]
+                elif plan_id is None:
+                    data["workout_plan_id"] = session.workout_plan_id
+            if errors:
+                results[index] = {"index": index, "status": "error", "errors": errors}
+                continue
+            logs.append(WorkoutLog(**data))
+            log_indexes.append(index)
+
+        with transaction.atomic():
+            if connection.features.can_return_rows_from_bulk_insert:
+                WorkoutLog.objects.bulk_create(logs)
+            else:
+                # MySQL cannot return ids from a bulk insert, and clients need
+                # them to match results to entries, so save row by row.
+                for log in logs:
+                    log._summary_refreshed_by_caller = True
+                    log.save()
+            # Refresh every touched summary once for the whole batch.
+            DailyTrainingSummary.objects.refresh(
+                {(log.member_id, log.date) for log in logs}
+            )
+            invalidate_todays_workout(*(log.member_id for log in logs))
+            invalidate_training_analytics(*(log.member_id for log in logs))
+
+        for index, log in zip(log_indexes, logs):
+            results[index] = {"index": index, "status": "created", "id": log.pk}
+
+        if not logs:
+            response_status = status.HTTP_400_BAD_REQUEST
+        elif len(logs) < len(entries):
+            response_status = status.HTTP_207_MULTI_STATUS
         else:
-            return WorkoutLog.objects.filter(member=user).select_related()
+            response_status = status.HTTP_201_CREATED
+        return Response(
+            {
+                "created": len(logs),
+                "failed": len(entries) - len(logs),
+                "results": results,
+            },
+            status=response_status,
+        )
+
+    analytics_max_members = 50
+
+    @action(detail=False, methods=["get"], url_path="analytics")
+    def analytics(self, request):
+        """e1RM, weekly tonnage and intensity curves for up to 50 members"""
+        user = request.user
+        raw = request.query_params.get("member", "")
+        if not raw and user.role == "member":
+            raw = str(user.id)
+        try:
+            member_ids = list(
+                dict.fromkeys(int(value) for value in raw.split(",") if value.strip())
+            )
+        except ValueError:
+            return Response(
+                {"error": "member must be a comma-separated list of ids."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if not member_ids:
+            return Response(
+                {"error": "At least one member id is required."},
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+        if len(member_ids) > self.analytics_max_members:
+            return Response(
+                {
+                    "error": f"Analytics cannot be requested for more than {self.analytics_max_members} members at once."
+                },
+                status=status.HTTP_400_BAD_REQUEST,
+            )
+
+        allowed = self._get_loggable_member_ids(set(member_ids))
+        denied = [member_id for member_id in member_ids if member_id not in allowed]
+        if denied:
+            return Response(
+                {"error": f"You cannot view analytics for members {denied}."},
+                status=status.HTTP_403_FORBIDDEN,
+            )
+        return Response({"members": training_analytics(member_ids)})
+
+    def _get_loggable_member_ids(self, member_ids):
+        """Return the subset of member_ids the current user may log workouts for"""
+        user = self.request.user
+        if not member_ids:
+            return set()
+        if user.role == "member":
+            return {user.id} & member_ids
+        if user.role == "trainer":
+            return self.get_trainer_member_ids() & member_ids
+        return set(
+            User.objects.filter(
+                id__in=member_ids, role="member", is_deleted=False
+            ).values_list("id", flat=True)
+        )
 
 
 # MemberProgress ViewSet
-class MemberProgressViewSet(viewsets.ModelViewSet):
+class MemberProgressViewSet(
+    RoleScopedQuerysetMixin, StreamingExportMixin, viewsets.ModelViewSet
+):
     serializer_class = MemberProgressSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
+    export_filename = "member_progress"
+    export_fields = [
+        "id",
+        "member_id",
+        "member__username",
+        "recorded_date",
+        "weight",
+        "body_fat_percentage",
+        "muscle_mass",
+        "measurements",
+        "notes",
+    ]
+    filter_fields = {"member": "member"}
+    range_filter_fields = {"recorded_date": "recorded_date"}
+    ordering_fields = ["recorded_date", "id"]
+    ordering = ["-recorded_date", "-id"]
 
     def get_queryset(self):
-        user = self.request.user
-        if user.role == "admin":
-            return MemberProgress.objects.all().select_related()
-        elif user.role == "trainer":
-            member_ids = TrainerMember.objects.filter(
-                trainer=user, is_active=True, is_deleted=False
-            ).values_list("member_id", flat=True)
-            return MemberProgress.objects.filter(
-                member_id__in=member_ids
-            ).select_related()
-        else:
-            return MemberProgress.objects.filter(member=user).select_related()
+        return self.scope_queryset(MemberProgress.objects.all().select_related())
 
     def get_permissions(self):
         if self.action in ["create", "update", "partial_update", "destroy"]:
@@ -141,23 +588,59 @@ class MemberProgressViewSet(viewsets.ModelViewSet):
 
 
 # WorkoutSession ViewSet
-class WorkoutSessionViewSet(viewsets.ModelViewSet):
+class WorkoutSessionViewSet(
+    RoleScopedQuerysetMixin, StreamingExportMixin, viewsets.ModelViewSet
+):
     serializer_class = WorkoutSessionSerializer
     permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer | IsMember]
+    export_filename = "workout_sessions"
+    export_fields = [
+        "id",
+        "member_id",
+        "member__username",
+        "workout_plan_id",
+        "workout_plan__name",
+        "start_time",
+        "end_time",
+        "status",
+        "total_calories_burned",
+        "active_minutes",
+        "total_volume",
+        "rating",
+        "feedback",
+    ]
+    filter_fields = {
+        "member": "member",
+        "workout_plan": "workout_plan",
+        "status": "status",
+    }
+    range_filter_fields = {"start_time": "start_time"}
+    ordering_fields = ["start_time", "id"]
+    ordering = ["-start_time", "-id"]
 
     def get_queryset(self):
-        user = self.request.user
-        if user.role == "admin":
-            return WorkoutSession.objects.all().select_related()
-        elif user.role == "trainer":
-            member_ids = TrainerMember.objects.filter(
-                trainer=user, is_active=True, is_deleted=False
-            ).values_list("member_id", flat=True)
-            return WorkoutSession.objects.filter(
-                member_id__in=member_ids
-            ).select_related()
-        else:
-            return WorkoutSession.objects.filter(member=user).select_related()
+        return self.scope_queryset(WorkoutSession.objects.all().select_related())
+
+    @action(detail=True, methods=["post"], url_path="complete")
+    def complete(self, request, pk=None):
+        """
+        Complete the session, computing calories, active minutes and volume
+        from its workout logs. Completing again recomputes the totals.
+        """
+        session = self.get_object()
+        serializer = WorkoutSessionCompleteSerializer(
+            session, data=request.data, partial=True
+        )
+        serializer.is_valid(raise_exception=True)
+        data = serializer.validated_data
+        for field in ("rating", "feedback"):
+            if field in data:
+                setattr(session, field, data[field])
+        with transaction.atomic():
+            if "rating" in data or "feedback" in data:
+                session.save(update_fields=["rating", "feedback"])
+            session.complete(data.get("end_time"))
+        return Response(WorkoutSessionSerializer(session).data)
 
 
 # BMIRecommendation ViewSet
@@ -191,54 +674,27 @@ class BMIRecommendationViewSet(viewsets.ViewSet):
             )
 
         bmi = weight / (height**2)
-        if bmi < 18.5:
-            category = "Underweight"
-        elif 18.5 <= bmi < 24.9:
-            category = "Normal weight"
-        elif 25 <= bmi < 29.9:
-            category = "Overweight"
-        else:
-            category = "Obese"
-
-        if category == "Underweight":
-            workout_plans = WorkoutPlan.objects.filter(
-                Q(goal="muscle_gain"), is_active=True
-            ).select_related()
-            exercises = Exercise.objects.filter(
-                Q(category="strength_training"), is_active=True
-            ).select_related()
-            nutrition_plans = NutritionPlan.objects.filter(
-                Q(calories__gte=2500), is_active=True
-            ).select_related()
-        elif category == "Normal weight":
-            workout_plans = WorkoutPlan.objects.filter(
-                Q(goal="general_fitness"), is_active=True
-            ).select_related()
-            exercises = Exercise.objects.filter(
-                Q(category="full_body"), is_active=True
-            ).select_related()
-            nutrition_plans = NutritionPlan.objects.filter(
-                Q(calories__range=(2000, 2500)), is_active=True
-            ).select_related()
-        elif category in ["Overweight", "Obese"]:
-            workout_plans = WorkoutPlan.objects.filter(
-                Q(goal="general_fitness") | Q(goal="fat_loss"), is_active=True
-            ).select_related()
-            exercises = Exercise.objects.filter(
-                Q(category="cardio"), is_active=True
-            ).select_related()
-            nutrition_plans = NutritionPlan.objects.filter(
-                Q(calories__lte=2000), is_active=True
-            ).select_related()
-
+        category = bmi_category(bmi)
         return Response(
-            {
-                "bmi": bmi,
-                "category": category,
-                "workout_plans": WorkoutPlanSerializer(workout_plans, many=True).data,
-                "exercises": ExerciseSerializer(exercises, many=True).data,
-                "nutrition_plans": NutritionPlanSerializer(
-                    nutrition_plans, many=True
-                ).data,
-            }
+            {"bmi": bmi, "category": category, **recommend(category, request.user)}
         )
+
+
+# TrainerDashboard ViewSet
+class TrainerDashboardViewSet(viewsets.ViewSet):
+    permission_classes = [IsSuperAdmin | IsAdmin | IsTrainer]
+
+    def list(self, request):
+        """Overview of the trainer's assigned members; admins pass ?trainer=<id>"""
+        user = request.user
+        if user.role == "trainer":
+            trainer_id = user.id
+        else:
+            try:
+                trainer_id = int(request.query_params.get("trainer", ""))
+            except ValueError:
+                return Response(
+                    {"error": "A trainer id is required."},
+                    status=status.HTTP_400_BAD_REQUEST,
+                )
+        return Response(trainer_dashboard(trainer_id))
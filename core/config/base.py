@@ -79,7 +79,13 @@ INTERNAL_IPS = [
 REST_FRAMEWORK = {
     "DEFAULT_SCHEMA_CLASS": "drf_spectacular.openapi.AutoSchema",
     "DEFAULT_AUTHENTICATION_CLASSES": (
-        "rest_framework_simplejwt.authentication.JWTAuthentication",
+        "core.apps.users.authentication.authentication.CachedJWTAuthentication",
+    ),
+    "DEFAULT_PAGINATION_CLASS": "core.apps.users.pagination.pagination.StandardPagination",
+    "PAGE_SIZE": 50,
+    "DEFAULT_FILTER_BACKENDS": (
+        "core.apps.users.filters.filters.IndexedFilterBackend",
+        "core.apps.users.filters.filters.IndexedOrderingFilter",
     ),
 }
 
@@ -95,6 +101,48 @@ SIMPLE_JWT = {
     "ROTATE_REFRESH_TOKENS": False,
     "BLACKLIST_AFTER_ROTATION": True,
     "AUTH_HEADER_TYPES": ("Bearer",),
+    "TOKEN_OBTAIN_SERIALIZER": "core.apps.users.serializers.serializers.SelfTokenObtainPairSerializer",
+}
+
+# In-process cache of the user fields read on every authenticated request
+AUTH_USER_CACHE = {
+    "MAXSIZE": 1024,
+    "TTL_SECONDS": 30,
+}
+
+# Deactivation of memberships past their end_date. The sweep also runs from
+# the deactivate_expired_memberships command; enable the in-process scheduler
+# only on the processes that should run it.
+MEMBERSHIP_EXPIRY = {
+    "SCHEDULER_ENABLED": config(
+        "MEMBERSHIP_EXPIRY_SCHEDULER_ENABLED", default=False, cast=bool
+    ),
+    "INTERVAL_SECONDS": 60 * 60,
+    "INITIAL_DELAY_SECONDS": 60,
+}
+
+# Monthly membership snapshots read by the analytics endpoint. The job runs
+# from the snapshot_memberships command (nightly) or the in-process scheduler
+# and refreshes the previous month through MONTHS_AHEAD months ahead.
+MEMBERSHIP_SNAPSHOTS = {
+    "SCHEDULER_ENABLED": config(
+        "MEMBERSHIP_SNAPSHOTS_SCHEDULER_ENABLED", default=False, cast=bool
+    ),
+    "INTERVAL_SECONDS": 24 * 60 * 60,
+    "INITIAL_DELAY_SECONDS": 5 * 60,
+    "MONTHS_AHEAD": 3,
+}
+
+# In-process bitmap of members with a current membership, used by check-in
+MEMBERSHIP_CHECKIN = {
+    "REFRESH_SECONDS": 5 * 60,
+}
+
+# Attendance events are buffered in process and written in batches
+ATTENDANCE_BUFFER = {
+    "MAX_RECORDS": 500,
+    "MAX_DELAY_MS": 1000,
+    "MAX_PENDING": 50000,
 }
 
 TEMPLATES = [
@@ -138,6 +186,25 @@ DATABASES = {
 }
 
 
+# Cache
+# Reference data and per-member versions (list ETags, today's workout,
+# recommendations, training analytics) live here, so every worker process
+# must see the same cache. LocMemCache is only for development: production
+# sets CACHE_BACKEND to a shared backend, e.g.
+# django.core.cache.backends.redis.RedisCache with CACHE_LOCATION
+# redis://host:6379/0. `manage.py check --deploy` fails with users.E001 when
+# DEBUG is off and the cache is still process-local.
+
+CACHES = {
+    "default": {
+        "BACKEND": config(
+            "CACHE_BACKEND", default="django.core.cache.backends.locmem.LocMemCache"
+        ),
+        "LOCATION": config("CACHE_LOCATION", default=""),
+    }
+}
+
+
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
 
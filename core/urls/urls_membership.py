@@ -1,6 +1,6 @@
 from django.urls import path, include
 from rest_framework.routers import DefaultRouter
-from core.apps.membership.views import MembershipViewSet
+from core.apps.membership.views import CheckInView, MembershipViewSet, OccupancyView
 
 # Create a router and register viewsets
 router = DefaultRouter()
@@ -8,5 +8,7 @@ router.register(r"memberships", MembershipViewSet, basename="membership")
 
 # URL patterns
 urlpatterns = [
+    path("check-in/<int:member_id>/", CheckInView.as_view(), name="check-in"),
+    path("attendance/present/", OccupancyView.as_view(), name="attendance-present"),
     path("", include(router.urls)),
 ]
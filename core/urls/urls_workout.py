@@ -8,6 +8,7 @@ from core.apps.workout.views import (
     MemberProgressViewSet,
     WorkoutSessionViewSet,
     BMIRecommendationViewSet,
+    TrainerDashboardViewSet,
 )
 
 # Create a router and register viewsets
@@ -24,6 +25,9 @@ router.register(r"workout-logs", WorkoutLogViewSet, basename="workoutlog")
 router.register(r"member-progress", MemberProgressViewSet, basename="memberprogress")
 router.register(r"workout-sessions", WorkoutSessionViewSet, basename="workoutsession")
 router.register(r"bmi", BMIRecommendationViewSet, basename="bmi-recommendation")
+router.register(
+    r"trainer-dashboard", TrainerDashboardViewSet, basename="trainer-dashboard"
+)
 
 # URL patterns
 urlpatterns = [